@@ -8,6 +8,7 @@ same messages when required dependencies are missing.
 
 from __future__ import annotations
 
+import inspect
 import platform
 import sys
 from typing import Any
@@ -34,6 +35,10 @@ except ImportError:
     print("Error: Pillow not available. Please install it with: pip install pillow")
     sys.exit(1)
 
+# Pillow-SIMD is a drop-in fork (same `PIL` package) with vectorized resampling;
+# its versions carry a ".postN" suffix.
+PILLOW_SIMD: bool = ".post" in getattr(Image, "__version__", "")
+
 # --- Required capture libs ---
 try:
     import mss  # type: ignore[import-not-found]
@@ -47,11 +52,15 @@ except ImportError:
     print("Error: screeninfo not available. Please install it with: pip install screeninfo")
     sys.exit(1)
 
+# --- Optional window enumeration fallback (pygetwindow) ---
+gw: Any = None
 try:
-    import pyautogui  # type: ignore[import-not-found]
-except ImportError:
-    print("Error: pyautogui not available. Please install it with: pip install pyautogui")
-    sys.exit(1)
+    import pygetwindow as _gw  # type: ignore[import-not-found]
+
+    gw = _gw
+except Exception:
+    # pygetwindow raises NotImplementedError on unsupported platforms.
+    gw = None
 
 # --- Platform-specific imports for window capture ---
 win32gui: Any = None
@@ -80,4 +89,23 @@ if platform.system() == "Windows":
 else:
     WINDOWS_CAPTURE_AVAILABLE = False
 
+# --- Optional Windows.Graphics.Capture backend (windows-capture) ---
+WGC_AVAILABLE: bool
+WGC_TAKES_HWND: bool = False
+WindowsCapture: Any = None
 
+if platform.system() == "Windows":
+    try:
+        from windows_capture import WindowsCapture as _WindowsCapture  # type: ignore[import-not-found]
+
+        WindowsCapture = _WindowsCapture
+        WGC_AVAILABLE = True
+        # Newer releases can target a window by handle instead of by exact title.
+        try:
+            WGC_TAKES_HWND = "window_hwnd" in inspect.signature(_WindowsCapture).parameters
+        except (TypeError, ValueError):
+            WGC_TAKES_HWND = False
+    except Exception:
+        WGC_AVAILABLE = False
+else:
+    WGC_AVAILABLE = False
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import ctypes
+import platform
+
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+HALFTONE = 4
+SRCCOPY = 0x00CC0020
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", BITMAPINFOHEADER),
+        ("bmiColors", ctypes.c_uint32 * 3),
+    ]
+
+
+_gdi32 = None
+
+
+def _get_gdi32():
+    """Load gdi32 with handle-safe signatures (64-bit HBITMAP/HDC)."""
+    global _gdi32
+    if _gdi32 is None:
+        gdi32 = ctypes.WinDLL("gdi32")  # type: ignore[attr-defined]
+        gdi32.CreateDIBSection.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(BITMAPINFO),
+            ctypes.c_uint,
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+        ]
+        gdi32.CreateDIBSection.restype = ctypes.c_void_p
+        gdi32.SelectObject.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        gdi32.SelectObject.restype = ctypes.c_void_p
+        gdi32.DeleteObject.argtypes = [ctypes.c_void_p]
+        gdi32.DeleteObject.restype = ctypes.c_int
+        gdi32.GdiFlush.argtypes = []
+        gdi32.GdiFlush.restype = ctypes.c_int
+        gdi32.CreateCompatibleDC.argtypes = [ctypes.c_void_p]
+        gdi32.CreateCompatibleDC.restype = ctypes.c_void_p
+        gdi32.DeleteDC.argtypes = [ctypes.c_void_p]
+        gdi32.DeleteDC.restype = ctypes.c_int
+        gdi32.SetStretchBltMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        gdi32.SetStretchBltMode.restype = ctypes.c_int
+        gdi32.SetBrushOrgEx.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+        gdi32.SetBrushOrgEx.restype = ctypes.c_int
+        gdi32.StretchBlt.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint32,
+        ]
+        gdi32.StretchBlt.restype = ctypes.c_int
+        gdi32.BitBlt.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint32,
+        ]
+        gdi32.BitBlt.restype = ctypes.c_int
+        _gdi32 = gdi32
+    return _gdi32
+
+
+def create_top_down_dib(hdc, width: int, height: int):
+    """Create a 32-bpp top-down DIB section.
+
+    Returns `(hbitmap, bits_address)`. Rows are stored top-down (negative
+    biHeight), so the pixel memory can be handed to Pillow as-is.
+    """
+    if platform.system() != "Windows":
+        raise OSError("DIB sections are only available on Windows")
+
+    gdi32 = _get_gdi32()
+
+    bmi = BITMAPINFO()
+    bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    bmi.bmiHeader.biWidth = width
+    bmi.bmiHeader.biHeight = -height  # negative height => top-down rows
+    bmi.bmiHeader.biPlanes = 1
+    bmi.bmiHeader.biBitCount = 32
+    bmi.bmiHeader.biCompression = BI_RGB
+
+    bits = ctypes.c_void_p()
+    hbitmap = gdi32.CreateDIBSection(hdc, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+    if not hbitmap or not bits.value:
+        raise OSError("CreateDIBSection failed")
+    return hbitmap, bits.value
+
+
+def select_object(hdc, hobject):
+    """SelectObject wrapper returning the previously selected object."""
+    return _get_gdi32().SelectObject(hdc, hobject)
+
+
+def delete_object(hobject) -> None:
+    """DeleteObject wrapper (ignores null handles)."""
+    if hobject:
+        _get_gdi32().DeleteObject(hobject)
+
+
+def dib_buffer(bits_address: int, width: int, height: int):
+    """Wrap DIB pixel memory as a ctypes byte array (no copy).
+
+    Flushes pending GDI drawing first so the memory is up to date.
+    """
+    _get_gdi32().GdiFlush()
+    return (ctypes.c_ubyte * (width * height * 4)).from_address(bits_address)
+
+
+def create_compatible_dc(hdc):
+    """CreateCompatibleDC wrapper (raises on failure)."""
+    mem_dc = _get_gdi32().CreateCompatibleDC(hdc)
+    if not mem_dc:
+        raise OSError("CreateCompatibleDC failed")
+    return mem_dc
+
+
+def delete_dc(hdc) -> None:
+    """DeleteDC wrapper (ignores null handles)."""
+    if hdc:
+        _get_gdi32().DeleteDC(hdc)
+
+
+def bit_blt(dst_hdc, width: int, height: int, src_hdc) -> bool:
+    """Copy a `width`x`height` block from `src_hdc` to `dst_hdc` (SRCCOPY)."""
+    return bool(_get_gdi32().BitBlt(dst_hdc, 0, 0, width, height, src_hdc, 0, 0, SRCCOPY))
+
+
+def stretch_blt_halftone(
+    dst_hdc, dst_w: int, dst_h: int, src_hdc, src_w: int, src_h: int, src_x: int = 0, src_y: int = 0
+) -> bool:
+    """Scale a `src_w`x`src_h` block of `src_hdc` (at `src_x`, `src_y`) into `dst_hdc`
+    with HALFTONE (area-averaging) filtering.
+
+    GDI does the downsample, so only the destination-sized pixels ever reach Python.
+    """
+    gdi32 = _get_gdi32()
+    gdi32.SetStretchBltMode(dst_hdc, HALFTONE)
+    # HALFTONE requires the brush origin to be reset after changing the mode.
+    gdi32.SetBrushOrgEx(dst_hdc, 0, 0, None)
+    return bool(
+        gdi32.StretchBlt(dst_hdc, 0, 0, dst_w, dst_h, src_hdc, src_x, src_y, src_w, src_h, SRCCOPY)
+    )
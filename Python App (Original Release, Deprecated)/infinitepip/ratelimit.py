@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Let an event through at most once per `interval` seconds for each key.
+
+    Used to throttle error logging in capture loops, where the same failure
+    can otherwise repeat many times a second.
+    """
+
+    def __init__(self, interval: float = 2.0) -> None:
+        self.interval = interval
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key) -> bool:
+        """Return True (and record the time) if `key` has not fired within the interval."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(key)
+            if last is not None and now - last <= self.interval:
+                return False
+            self._last[key] = now
+            return True
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import socketserver
+from concurrent.futures import ThreadPoolExecutor
 
 
 class RemoteControlHandler(socketserver.BaseRequestHandler):
@@ -49,15 +50,42 @@ class RemoteControlHandler(socketserver.BaseRequestHandler):
             return {"status": "error", "message": str(e)}
 
 
-class RemoteControlServer(socketserver.ThreadingTCPServer):
-    """TCP server for remote control functionality"""
+class RemoteControlServer(socketserver.TCPServer):
+    """TCP server for remote control functionality.
+
+    Requests are handled on a small fixed worker pool instead of one new thread
+    per connection, so a burst of clients cannot spawn unbounded threads.
+    """
 
     allow_reuse_address = True
+    request_queue_size = 16
+    max_workers = 4
+    request_timeout = 5.0  # seconds; keeps a stalled client from pinning a worker
 
     def __init__(self, host, port, app_instance):
         super().__init__((host, port), RemoteControlHandler)
         self.app_instance = app_instance
-        self.daemon_threads = True
-
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ipip-remote"
+        )
 
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool."""
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Pool already shut down (server closing).
+            self.shutdown_request(request)
 
+    def _process_request_worker(self, request, client_address):
+        try:
+            request.settimeout(self.request_timeout)
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
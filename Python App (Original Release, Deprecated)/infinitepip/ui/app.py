@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import functools
+import logging
+import operator
+import re
 import threading
+import time
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import font as tkfont
 from tkinter import messagebox, ttk
 
 from ..deps import (
@@ -10,39 +18,360 @@ from ..deps import (
     ImageTk,
     TRAY_AVAILABLE,
     WINDOWS_CAPTURE_AVAILABLE,
+    gw,
     mss,
     pystray,
     screeninfo,
-    win32con,
     win32gui,
-    win32ui,
     windll,
 )
+from ..platform.gdi import (
+    bit_blt,
+    create_compatible_dc,
+    create_top_down_dib,
+    delete_dc,
+    delete_object,
+    dib_buffer,
+    select_object,
+    stretch_blt_halftone,
+)
+from ..ratelimit import RateLimiter
 from ..remote_control import RemoteControlServer
 from .pip_window import InfinitePIPWindow
 from .screen_selector import ScreenAreaSelector
 from .widgets import ModernButton, ModernCard, ModernScrollableFrame
 
+log = logging.getLogger(__name__)
+# Capture failures tend to repeat for every preview in a burst; log each kind once per 2s.
+_log_limiter = RateLimiter(2.0)
+
+# Modern color palette (match TSX Tailwind palette closely)
+_COLORS = {
+    "bg_primary": "#030712",  # gray-950
+    "bg_secondary": "#111827",  # gray-900
+    "bg_card": "#111827",  # gray-900
+    "bg_card_hover": "#1f2937",  # gray-800
+    "bg_input": "#1f2937",  # gray-800
+    "accent_primary": "#f97316",  # orange-500
+    "accent_primary_hover": "#ea580c",  # orange-600
+    "accent_secondary": "#22c55e",  # green-500
+    "accent_danger": "#dc2626",  # red-600
+    "accent_danger_hover": "#b91c1c",  # red-700
+    "text_primary": "#f9fafb",  # near-white
+    "text_secondary": "#9ca3af",  # gray-400
+    "text_muted": "#6b7280",  # gray-500
+    "border": "#1f2937",  # gray-800
+    "border_strong": "#374151",  # gray-700
+}
+
+
+class _Palette:
+    """Read-only theme colors with fixed-slot attribute access (`colors.bg_card`)."""
+
+    __slots__ = tuple(_COLORS)
+
+    def __init__(self, **colors):
+        for name, value in colors.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("palette is read-only")
+
+
+# Shared font tuples
+_FONT_SMALL = ("Segoe UI", 8)
+_FONT_BODY = ("Segoe UI", 10)
+_FONT_BODY_BOLD = ("Segoe UI", 10, "bold")
+_FONT_CARD_TITLE = ("Segoe UI", 12, "bold")
+_FONT_SECTION_TITLE = ("Segoe UI", 18, "bold")
+
+# Whole-number check for the region entry fields.
+_INT_RE = re.compile(r"^-?\d+$")
+
+# Window thumbnails: LRU-bounded, and re-captured once older than the TTL so
+# live window content still refreshes.
+_WINDOW_PREVIEW_CACHE_SIZE = 128
+_WINDOW_PREVIEW_TTL = 5.0  # seconds
+
+
+def _screenshot_to_image(screenshot):
+    """Decode an mss screenshot from its raw BGRA buffer.
+
+    Reading `screenshot.raw` skips the `bytes` copy behind `.bgra` and the Python-side
+    repack behind `.rgb`. The image still gets one copy: Pillow's BGRX decode always
+    unpacks into its own storage rather than wrapping the buffer.
+    """
+    return Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1)
+
+
+def _set_entry(entry, value):
+    """Replace an Entry's text with `value`, skipping the Tcl calls when it already matches."""
+    text = str(value)
+    if entry.get() == text:
+        return
+    entry.delete(0, tk.END)
+    entry.insert(0, text)
+
+
+def _make_thumbnail(image, size):
+    """Downscale a full-resolution capture to a small preview thumbnail.
+
+    `draft` lets decoders that support it (JPEG) emit a pre-reduced image; `reducing_gap`
+    then box-reduces by an integer factor (a cheap C pass), so LANCZOS only filters an
+    image at most ~2x the final size.
+    """
+    image.draft("RGB", size)
+    return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+# ttk style table installed by `setup_modern_theme` as (style name, options) pairs.
+_STYLE_SPECS = (
+    # Main frame styles
+    ("Modern.TFrame", {"background": _COLORS["bg_primary"]}),
+    (
+        "ModernCard.TFrame",
+        {"background": _COLORS["bg_card"], "relief": "flat", "borderwidth": 1},
+    ),
+    (
+        "ModernCardHover.TFrame",
+        {"background": _COLORS["bg_card_hover"], "relief": "flat", "borderwidth": 1},
+    ),
+    # Typography styles
+    (
+        "ModernTitle.TLabel",
+        {
+            "font": ("Segoe UI", 32, "bold"),
+            "background": _COLORS["bg_primary"],
+            "foreground": _COLORS["accent_primary"],  # TSX title is orange
+        },
+    ),
+    (
+        "ModernSubtitle.TLabel",
+        {
+            "font": ("Segoe UI", 16),
+            "background": _COLORS["bg_primary"],
+            "foreground": _COLORS["text_secondary"],
+        },
+    ),
+    (
+        "SectionTitle.TLabel",
+        {
+            "font": _FONT_SECTION_TITLE,
+            "background": _COLORS["bg_primary"],
+            "foreground": _COLORS["text_primary"],
+        },
+    ),
+    (
+        "CardTitle.TLabel",
+        {
+            "font": ("Segoe UI", 14, "bold"),
+            "background": _COLORS["bg_card"],
+            "foreground": _COLORS["text_primary"],
+        },
+    ),
+    (
+        "CardSubtitle.TLabel",
+        {
+            "font": ("Segoe UI", 11),
+            "background": _COLORS["bg_card"],
+            "foreground": _COLORS["text_secondary"],
+        },
+    ),
+    (
+        "ModernText.TLabel",
+        {
+            "font": _FONT_BODY,
+            "background": _COLORS["bg_primary"],
+            "foreground": _COLORS["text_primary"],
+        },
+    ),
+    # Button styles
+    (
+        "ModernPrimary.TButton",
+        {
+            "background": _COLORS["accent_primary"],
+            "foreground": "white",
+            "font": _FONT_BODY_BOLD,
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (20, 10),
+        },
+    ),
+    (
+        "ModernSecondary.TButton",
+        {
+            "background": _COLORS["bg_card_hover"],  # TSX secondary buttons are gray-800
+            "foreground": _COLORS["text_primary"],
+            "font": _FONT_BODY,
+            "borderwidth": 1,
+            "relief": "flat",
+            "padding": (16, 8),
+        },
+    ),
+    (
+        "ModernSuccess.TButton",
+        {
+            "background": _COLORS["accent_secondary"],
+            "foreground": "white",
+            "font": _FONT_BODY_BOLD,
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (16, 8),
+        },
+    ),
+    (
+        "ModernDanger.TButton",
+        {
+            "background": _COLORS["accent_danger"],
+            "foreground": "white",
+            "font": _FONT_BODY_BOLD,
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (16, 8),
+        },
+    ),
+    # Notebook styles kept for any ttk internals (we use a custom tab bar)
+    ("Modern.TNotebook", {"background": _COLORS["bg_primary"], "borderwidth": 0}),
+    ("Modern.TNotebook.Tab", {"padding": [0, 0]}),
+    # Entry styles
+    (
+        "Modern.TEntry",
+        {
+            "fieldbackground": _COLORS["bg_input"],
+            "borderwidth": 1,
+            "relief": "flat",
+            "insertcolor": _COLORS["text_primary"],
+            "foreground": _COLORS["text_primary"],
+        },
+    ),
+)
+
+_STYLE_MAPS = (
+    (
+        "ModernPrimary.TButton",
+        {
+            "background": [
+                ("active", _COLORS["accent_primary_hover"]),
+                ("pressed", "#c2410c"),  # orange-700-ish
+            ]
+        },
+    ),
+    ("ModernSecondary.TButton", {"background": [("active", "#374151")]}),  # gray-700 hover
+    ("ModernDanger.TButton", {"background": [("active", _COLORS["accent_danger_hover"])]}),
+)
+
+# Shared ttk style kwargs for widgets built repeatedly (list rebuilds, previews).
+_TEXT_LABEL_KW = {"style": "ModernText.TLabel"}
+_CARD_TITLE_LABEL_KW = {"style": "CardTitle.TLabel"}
+_CARD_SUBTITLE_LABEL_KW = {"style": "CardSubtitle.TLabel"}
+_ENTRY_KW = {"style": "Modern.TEntry"}
+
+# Shared tk option kwargs for card contents (cards are rebuilt on list refreshes).
+_CARD_FRAME_KW = {
+    "padding": 16,
+    "bg": _COLORS["bg_card"],
+    "border": _COLORS["border"],
+    "border_hover": _COLORS["accent_primary"],
+}
+_CARD_BG_KW = {"bg": _COLORS["bg_card"]}
+_CARD_TITLE_KW = {"bg": _COLORS["bg_card"], "fg": _COLORS["text_primary"], "font": _FONT_CARD_TITLE}
+_CARD_SPEC_KW = {"bg": _COLORS["bg_card"], "fg": _COLORS["text_secondary"], "font": _FONT_BODY}
+_CARD_LOADING_KW = {
+    "text": "Loading…",
+    "font": _FONT_SMALL,
+    "bg": _COLORS["bg_card"],
+    "fg": _COLORS["text_muted"],
+}
+
+_WINDOW_SORT_KEY = operator.itemgetter("_sort_key")
+
+# (row, column, padx) for each of the four region fields, per responsive column count.
+_REGION_FIELD_LAYOUTS = {
+    cols: tuple((i // cols, i % cols, (0 if i % cols == 0 else 14, 0)) for i in range(4))
+    for cols in (1, 2, 4)
+}
+
+# Regions tab switches to two columns at this width; it only drops back to one
+# column once the width falls a few pixels below it, so a drag that hovers around
+# the breakpoint does not flip the layout on every +-1px Configure.
+_REGIONS_TWO_COLUMN_WIDTH = 900
+_REGIONS_COLUMN_HYSTERESIS = 8
+
 
 class InfinitePIPModernUI:
     """Completely reimagined modern UI for InfinitePIP"""
 
+    # Shared options for every "Preview unavailable" thumbnail placeholder.
+    _PREVIEW_UNAVAIL_KW = {
+        "text": "Preview unavailable",
+        "font": _FONT_SMALL,
+        "fg": _COLORS["text_muted"],
+    }
+
+    # The tray icon is deterministic; it is drawn once per process (see _get_tray_icon).
+    _TRAY_ICON = None
+
     def __init__(self):
         self.root = tk.Tk()
-        self.active_pips = []
+        self.active_pips = {}  # insertion-ordered set of PIP windows (values unused)
+        self._bulk_closing = False  # set while closing every PIP; remove_pip defers to the caller
+        self._ui_sync_after_id = None  # pending status + PIP list refresh (see _request_ui_sync)
         self.monitors = list(screeninfo.get_monitors())
+        self._monitors_cache_ts = time.monotonic()  # when self.monitors was last queried
+        self._monitor_display = self._format_monitor_display(self.monitors)
         self.windows = []
+        self._windows_by_hwnd = {}  # hwnd -> entry of self.windows
+        self._windows_by_title = {}  # title -> entry of self.windows (entries without hwnd)
         self.tray_icon = None
         self.is_closing = False
         self.remote_server = None
 
+        # Background workers for blocking OS queries (window enumeration, captures).
+        # Results are always marshalled back to the Tk thread via `root.after`.
+        self._capture_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ipip-capture")
+        # Window enumeration gets its own worker so a refresh never queues behind thumbnails.
+        self._enum_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ipip-enum")
+        self._windows_enum_cache = None  # (monotonic timestamp, windows list)
+        self._windows_enum_future = None
+        self._refresh_windows_after_id = None
+
         # UI references used for responsive/conditional rendering
         self._close_all_button = None
+        self._close_all_visible = False  # packed state of _close_all_button, tracked in Python
         self._regions_cards_container = None
         self._regions_input_card = None
         self._regions_preview_card = None
-        self._regions_layout_after_id = None
+        self._regions_layout_pending = False
         self._regions_columns_current = None
+        self.active_pips_container = None  # Built on first visit to the Active PIPs tab
+        self.windows_container = None  # Built on first visit to the Windows tab
+        self._tabs = None
+        self._tabbar_canvas = None
+        self._header_subtitle_label = None
+        self._footer_info_label = None
+        self._monitors_grid_container = None
+        self._monitors_scroll_area = None
+        self._monitor_cards = []
+        self._region_fields_container = None
+        # Visual region selection creates the PIP straight away instead of asking first.
+        self.auto_create_region_pip = True
+
+        # Monitor thumbnails keyed by (index, thumb w, thumb h, monitor w, monitor h).
+        # Cleared only by an explicit "Refresh All".
+        self._monitor_preview_cache = {}
+        # Window thumbnails keyed by (hwnd, window w, window h) -> (captured_at, PhotoImage).
+        self._window_preview_cache = OrderedDict()
+        # Displayed PhotoImages, keyed by the Tk path of the label showing them. Tk does
+        # not hold a Python reference, so this keeps on-screen thumbnails alive.
+        self._photo_refs = {}
+
+        # One persistent mss instance per thread (mss objects are not thread-safe);
+        # bumping the generation makes every thread reopen it (monitor layout changes).
+        self._sct_local = threading.local()
+
+        # hwnd -> (checked_at, capturable) for `_window_is_capturable`.
+        self._capturable_cache = {}
+        self._sct_generation = 0
 
         # Initialize UI
         self.setup_modern_theme()
@@ -65,157 +394,19 @@ class InfinitePIPModernUI:
         self.style.theme_use("clam")
 
         # Modern color palette
-        self.colors = {
-            # Match TSX Tailwind palette closely
-            "bg_primary": "#030712",  # gray-950
-            "bg_secondary": "#111827",  # gray-900
-            "bg_card": "#111827",  # gray-900
-            "bg_card_hover": "#1f2937",  # gray-800
-            "bg_input": "#1f2937",  # gray-800
-            "accent_primary": "#f97316",  # orange-500
-            "accent_primary_hover": "#ea580c",  # orange-600
-            "accent_secondary": "#22c55e",  # green-500
-            "accent_danger": "#dc2626",  # red-600
-            "accent_danger_hover": "#b91c1c",  # red-700
-            "text_primary": "#f9fafb",  # near-white
-            "text_secondary": "#9ca3af",  # gray-400
-            "text_muted": "#6b7280",  # gray-500
-            "border": "#1f2937",  # gray-800
-            "border_strong": "#374151",  # gray-700
-        }
+        self.colors = _Palette(**_COLORS)
 
         # Configure root window
-        self.root.configure(bg=self.colors["bg_primary"])
-
-        # Main frame styles
-        self.style.configure("Modern.TFrame", background=self.colors["bg_primary"])
-        self.style.configure(
-            "ModernCard.TFrame",
-            background=self.colors["bg_card"],
-            relief="flat",
-            borderwidth=1,
-        )
-        self.style.configure(
-            "ModernCardHover.TFrame",
-            background=self.colors["bg_card_hover"],
-            relief="flat",
-            borderwidth=1,
-        )
-
-        # Typography styles
-        self.style.configure(
-            "ModernTitle.TLabel",
-            font=("Segoe UI", 32, "bold"),
-            background=self.colors["bg_primary"],
-            foreground=self.colors["accent_primary"],  # TSX title is orange
-        )
-
-        self.style.configure(
-            "ModernSubtitle.TLabel",
-            font=("Segoe UI", 16),
-            background=self.colors["bg_primary"],
-            foreground=self.colors["text_secondary"],
-        )
-
-        self.style.configure(
-            "SectionTitle.TLabel",
-            font=("Segoe UI", 18, "bold"),
-            background=self.colors["bg_primary"],
-            foreground=self.colors["text_primary"],
-        )
-
-        self.style.configure(
-            "CardTitle.TLabel",
-            font=("Segoe UI", 14, "bold"),
-            background=self.colors["bg_card"],
-            foreground=self.colors["text_primary"],
-        )
-
-        self.style.configure(
-            "CardSubtitle.TLabel",
-            font=("Segoe UI", 11),
-            background=self.colors["bg_card"],
-            foreground=self.colors["text_secondary"],
-        )
-
-        self.style.configure(
-            "ModernText.TLabel",
-            font=("Segoe UI", 10),
-            background=self.colors["bg_primary"],
-            foreground=self.colors["text_primary"],
-        )
-
-        # Button styles
-        self.style.configure(
-            "ModernPrimary.TButton",
-            background=self.colors["accent_primary"],
-            foreground="white",
-            font=("Segoe UI", 10, "bold"),
-            borderwidth=0,
-            relief="flat",
-            padding=(20, 10),
-        )
-
-        self.style.map(
-            "ModernPrimary.TButton",
-            background=[
-                ("active", self.colors["accent_primary_hover"]),
-                ("pressed", "#c2410c"),  # orange-700-ish
-            ],
-        )
-
-        self.style.configure(
-            "ModernSecondary.TButton",
-            background=self.colors["bg_card_hover"],  # TSX secondary buttons are gray-800
-            foreground=self.colors["text_primary"],
-            font=("Segoe UI", 10),
-            borderwidth=1,
-            relief="flat",
-            padding=(16, 8),
-        )
-
-        self.style.map(
-            "ModernSecondary.TButton",
-            background=[("active", "#374151")],  # gray-700 hover
-        )
-
-        self.style.configure(
-            "ModernSuccess.TButton",
-            background=self.colors["accent_secondary"],
-            foreground="white",
-            font=("Segoe UI", 10, "bold"),
-            borderwidth=0,
-            relief="flat",
-            padding=(16, 8),
-        )
-
-        self.style.configure(
-            "ModernDanger.TButton",
-            background=self.colors["accent_danger"],
-            foreground="white",
-            font=("Segoe UI", 10, "bold"),
-            borderwidth=0,
-            relief="flat",
-            padding=(16, 8),
-        )
-        self.style.map(
-            "ModernDanger.TButton",
-            background=[("active", self.colors["accent_danger_hover"])],
-        )
+        self.root.configure(bg=self.colors.bg_primary)
 
-        # Notebook styles kept for any ttk internals (we use a custom tab bar)
-        self.style.configure("Modern.TNotebook", background=self.colors["bg_primary"], borderwidth=0)
-        self.style.configure("Modern.TNotebook.Tab", padding=[0, 0])
-
-        # Entry styles
-        self.style.configure(
-            "Modern.TEntry",
-            fieldbackground=self.colors["bg_input"],
-            borderwidth=1,
-            relief="flat",
-            insertcolor=self.colors["text_primary"],
-            foreground=self.colors["text_primary"],
-        )
+        # Install the whole style table in one pass.
+        # (Each instance owns a fresh Tk interpreter, so styles are always installed.)
+        configure = self.style.configure
+        for name, options in _STYLE_SPECS:
+            configure(name, **options)
+        style_map = self.style.map
+        for name, options in _STYLE_MAPS:
+            style_map(name, **options)
 
     def setup_window(self):
         """Setup main window with modern properties"""
@@ -238,7 +429,7 @@ class InfinitePIPModernUI:
             return
 
         # Create tray icon
-        icon_image = self.create_tray_icon()
+        icon_image = self._get_tray_icon()
 
         # Create tray menu
         menu = pystray.Menu(
@@ -264,7 +455,15 @@ class InfinitePIPModernUI:
         self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
         self.tray_thread.start()
 
-    def create_tray_icon(self):
+    @classmethod
+    def _get_tray_icon(cls):
+        """Return the shared tray icon image, drawing it on first use."""
+        if cls.__dict__.get("_TRAY_ICON") is None:
+            cls._TRAY_ICON = cls.create_tray_icon()
+        return cls._TRAY_ICON
+
+    @staticmethod
+    def create_tray_icon():
         """Create a custom tray icon"""
         # Create a simple icon with PIL
         width = 64
@@ -276,8 +475,8 @@ class InfinitePIPModernUI:
         # Outer rectangle (main screen)
         draw.rectangle(
             [8, 8, width - 8, height - 8],
-            fill="#f97316",
-            outline="#ea580c",
+            fill=(249, 115, 22, 255),  # #f97316
+            outline=(234, 88, 12, 255),  # #ea580c
             width=2,
         )
 
@@ -287,8 +486,8 @@ class InfinitePIPModernUI:
         pip_y = height - pip_size - 12
         draw.rectangle(
             [pip_x, pip_y, pip_x + pip_size, pip_y + pip_size],
-            fill="#10b981",
-            outline="#059669",
+            fill=(16, 185, 129, 255),  # #10b981
+            outline=(5, 150, 105, 255),  # #059669
             width=2,
         )
 
@@ -301,7 +500,7 @@ class InfinitePIPModernUI:
                 pip_x + pip_size - 2,
                 pip_y + 2 + dot_size,
             ],
-            fill="#ffffff",
+            fill=(255, 255, 255, 255),
         )
 
         return image
@@ -354,16 +553,22 @@ class InfinitePIPModernUI:
         self.is_closing = True
 
         # Close all PIPs
-        for pip in self.active_pips[:]:
-            try:
-                pip.close()
-            except Exception:
-                pass
+        self._close_every_pip()
 
         # Stop tray icon
         if TRAY_AVAILABLE and self.tray_icon:
             self.tray_icon.stop()
 
+        # Stop background workers
+        self._capture_pool.shutdown(wait=False)
+        self._enum_pool.shutdown(wait=False)
+        sct = getattr(self._sct_local, "sct", None)
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
         # Stop remote server
         if self.remote_server:
             try:
@@ -401,23 +606,20 @@ class InfinitePIPModernUI:
         def create_pip():
             try:
                 # Add the window to our list if it's not already there
-                existing_window = None
-                for window in self.windows:
-                    if window.get("hwnd") == window_data.get("hwnd"):
-                        existing_window = window
-                        break
+                existing_window = self._windows_by_hwnd.get(window_data.get("hwnd"))
 
                 if not existing_window:
                     self.windows.append(window_data)
+                    self._windows_by_hwnd[window_data.get("hwnd")] = window_data
+                    self._windows_by_title.setdefault(window_data.get("title"), window_data)
                     # Update windows list UI if it exists
-                    if hasattr(self, "windows_container"):
+                    if self.windows_container is not None:
                         self.update_windows_list()
 
                 # Create the PIP
                 pip_window = InfinitePIPWindow("window", window_data, self)
-                self.active_pips.append(pip_window)
-                self.update_status()
-                self.update_active_pips_list()
+                self.active_pips[pip_window] = None
+                self._request_ui_sync()
 
                 # Show window if it's hidden
                 if self.root.state() == "withdrawn":
@@ -457,7 +659,7 @@ class InfinitePIPModernUI:
         self.create_header(main_container)
 
         # Content area (expands)
-        content_frame = tk.Frame(main_container, bg=self.colors["bg_primary"])
+        content_frame = tk.Frame(main_container, bg=self.colors.bg_primary)
         content_frame.grid(row=1, column=0, sticky="nsew")
         content_frame.grid_rowconfigure(0, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
@@ -468,39 +670,40 @@ class InfinitePIPModernUI:
         self.create_footer(main_container)
 
         # Keep text responsive on resize (wrap long labels)
+        self._root_resize_pending = False
         self.root.bind("<Configure>", self._on_root_resize, add="+")
 
     def create_header(self, parent):
         """Create modern header with title and status"""
-        header_outer = tk.Frame(parent, bg=self.colors["bg_secondary"])
+        header_outer = tk.Frame(parent, bg=self.colors.bg_secondary)
         header_outer.grid(row=0, column=0, sticky="ew")
         header_outer.grid_columnconfigure(0, weight=1)
 
         # Header content
-        header_frame = tk.Frame(header_outer, bg=self.colors["bg_secondary"])
+        header_frame = tk.Frame(header_outer, bg=self.colors.bg_secondary)
         header_frame.grid(row=0, column=0, sticky="ew", padx=24, pady=16)
         header_frame.grid_columnconfigure(0, weight=1)
         header_frame.grid_columnconfigure(1, weight=0)
 
         # Bottom border line (TSX: border-b border-gray-800)
-        tk.Frame(header_outer, bg=self.colors["border"], height=1).grid(
+        tk.Frame(header_outer, bg=self.colors.border, height=1).grid(
             row=1, column=0, sticky="ew"
         )
 
         # Left side - Title and subtitle
-        title_section = tk.Frame(header_frame, bg=self.colors["bg_secondary"])
+        title_section = tk.Frame(header_frame, bg=self.colors.bg_secondary)
         title_section.grid(row=0, column=0, sticky="w")
 
         # Icon + title (match TSX "🔥 InfinitePIP")
-        title_row = tk.Frame(title_section, bg=self.colors["bg_secondary"])
+        title_row = tk.Frame(title_section, bg=self.colors.bg_secondary)
         title_row.grid(row=0, column=0, sticky="w")
 
         icon_label = ttk.Label(
             title_row,
             text="🔥",
             font=("Segoe UI", 34),
-            background=self.colors["bg_secondary"],
-            foreground=self.colors["accent_primary"],
+            background=self.colors.bg_secondary,
+            foreground=self.colors.accent_primary,
         )
         icon_label.grid(row=0, column=0, sticky="w", padx=(0, 12))
 
@@ -517,90 +720,111 @@ class InfinitePIPModernUI:
         self._header_subtitle_label.grid(row=1, column=0, sticky="w", pady=(5, 0))
 
         # Right side - Status and info
-        status_section = tk.Frame(header_frame, bg=self.colors["bg_secondary"])
+        # Fixed-size box (240x60 px at 96 DPI, given in points so it scales) with
+        # propagation off: status/counter text changes never re-solve the header layout.
+        status_section = tk.Frame(
+            header_frame, bg=self.colors.bg_secondary, width="180p", height="45p"
+        )
         status_section.grid(row=0, column=1, sticky="e")
+        status_section.grid_propagate(False)
+        status_section.grid_columnconfigure(0, weight=1)
 
         # Status row: dot + label (TSX: small colored dot + text)
-        status_row = tk.Frame(status_section, bg=self.colors["bg_secondary"])
+        status_row = tk.Frame(status_section, bg=self.colors.bg_secondary)
         status_row.grid(row=0, column=0, sticky="e")
 
         self._status_dot = tk.Canvas(
             status_row,
             width=10,
             height=10,
-            bg=self.colors["bg_secondary"],
+            bg=self.colors.bg_secondary,
             highlightthickness=0,
         )
         self._status_dot.grid(row=0, column=0, sticky="e", padx=(0, 8))
         self._status_dot_id = self._status_dot.create_oval(
-            1, 1, 9, 9, fill=self.colors["accent_secondary"], outline=""
+            1, 1, 9, 9, fill=self.colors.accent_secondary, outline=""
         )
 
         self.status_label = tk.Label(
             status_row,
             text="Ready",
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 10, "bold"),
+            bg=self.colors.bg_secondary,
+            fg=self.colors.text_primary,
+            font=_FONT_BODY_BOLD,
         )
         self.status_label.grid(row=0, column=1, sticky="e")
 
         # Counter row: orange number + gray text (TSX: number orange-500)
-        counter_row = tk.Frame(status_section, bg=self.colors["bg_secondary"])
+        counter_row = tk.Frame(status_section, bg=self.colors.bg_secondary)
         counter_row.grid(row=1, column=0, sticky="e", pady=(6, 0))
 
         self._pips_counter_number = tk.Label(
             counter_row,
             text="0",
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["accent_primary"],
-            font=("Segoe UI", 10, "bold"),
+            bg=self.colors.bg_secondary,
+            fg=self.colors.accent_primary,
+            font=_FONT_BODY_BOLD,
         )
         self._pips_counter_number.grid(row=0, column=0, sticky="e")
+        self._last_status_pip_count = 0  # what the header currently shows
 
         self.pips_counter = tk.Label(
             counter_row,
             text=" Active PIPs",
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            bg=self.colors.bg_secondary,
+            fg=self.colors.text_secondary,
+            font=_FONT_BODY,
         )
         self.pips_counter.grid(row=0, column=1, sticky="e")
 
     def create_modern_tabs(self, parent):
         """Create TSX-style tab bar + content stack (custom, not ttk.Notebook)."""
-        container = tk.Frame(parent, bg=self.colors["bg_primary"])
+        container = tk.Frame(parent, bg=self.colors.bg_primary)
         container.grid(row=0, column=0, sticky="nsew")
         container.grid_rowconfigure(1, weight=1)
         container.grid_columnconfigure(0, weight=1)
 
         # Tab bar (TSX: bg-gray-900 with bottom border)
-        tabbar_outer = tk.Frame(container, bg=self.colors["bg_secondary"])
+        tabbar_outer = tk.Frame(container, bg=self.colors.bg_secondary)
         tabbar_outer.grid(row=0, column=0, sticky="ew")
         tabbar_outer.grid_columnconfigure(0, weight=1)
 
-        tabbar = tk.Frame(tabbar_outer, bg=self.colors["bg_secondary"])
+        # The whole tab strip is drawn on one canvas (labels + underlines as items)
+        # rather than a Label and an underline Frame per tab.
+        label_font = tkfont.Font(root=self.root, font=_FONT_BODY_BOLD)
+        tab_pad_x, tab_pad_y = 18, 10
+        tabbar_height = label_font.metrics("linespace") + 2 * tab_pad_y + 2
+        tabbar = tk.Canvas(
+            tabbar_outer,
+            height=tabbar_height,
+            bg=self.colors.bg_secondary,
+            highlightthickness=0,
+            bd=0,
+        )
         tabbar.grid(row=0, column=0, sticky="ew", padx=24)
+        self._tabbar_canvas = tabbar
 
-        tk.Frame(tabbar_outer, bg=self.colors["border"], height=1).grid(
+        tk.Frame(tabbar_outer, bg=self.colors.border, height=1).grid(
             row=1, column=0, sticky="ew"
         )
 
         # Content stack
-        self._tab_stack = tk.Frame(container, bg=self.colors["bg_primary"])
+        self._tab_stack = tk.Frame(container, bg=self.colors.bg_primary)
         self._tab_stack.grid(row=1, column=0, sticky="nsew")
         self._tab_stack.grid_rowconfigure(0, weight=1)
         self._tab_stack.grid_columnconfigure(0, weight=1)
 
         # Build tab pages
         self._tabs = {}
-        self._tab_buttons = {}
-        self._tab_underlines = {}
 
-        self._tabs["monitors"] = self.create_monitors_tab(self._tab_stack)
-        self._tabs["windows"] = self.create_windows_tab(self._tab_stack)
-        self._tabs["regions"] = self.create_regions_tab(self._tab_stack)
-        self._tabs["active"] = self.create_active_pips_tab(self._tab_stack)
+        # Pages are built on first visit (see show_tab); only the default tab
+        # is constructed at startup.
+        self._tab_factories = {
+            "monitors": self.create_monitors_tab,
+            "windows": self.create_windows_tab,
+            "regions": self.create_regions_tab,
+            "active": self.create_active_pips_tab,
+        }
 
         # Create tab buttons
         tab_defs = [
@@ -610,34 +834,43 @@ class InfinitePIPModernUI:
             ("active", "Active PIPs"),
         ]
 
-        for i, (tab_id, label) in enumerate(tab_defs):
-            btn = tk.Label(
-                tabbar,
-                text=label,
-                bg=self.colors["bg_secondary"],
-                fg=self.colors["text_secondary"],
-                font=("Segoe UI", 10),
-                padx=18,
-                pady=10,
-                cursor="hand2",
+        x = 0
+        for tab_id, label in tab_defs:
+            # Width is measured in the bold face so the strip never shifts when a tab activates.
+            w = label_font.measure(label) + 2 * tab_pad_x
+            tabbar.create_rectangle(
+                x, 0, x + w, tabbar_height,
+                fill=self.colors.bg_secondary, outline="", tags=("tab", tab_id),
             )
-            btn.grid(row=0, column=i, sticky="w")
-            btn.bind("<Button-1>", lambda _e, t=tab_id: self.show_tab(t), add="+")
-
-            underline = tk.Frame(tabbar, bg=self.colors["bg_secondary"], height=2, width=1)
-            underline.grid(row=1, column=i, sticky="ew")
+            tabbar.create_text(
+                x + w // 2, (tabbar_height - 2) // 2,
+                text=label, font=_FONT_BODY, fill=self.colors.text_secondary,
+                tags=("tab", "tablabel", tab_id),
+            )
+            tabbar.create_rectangle(
+                x, tabbar_height - 2, x + w, tabbar_height,
+                fill=self.colors.bg_secondary, outline="", tags=("tab", "tabline", tab_id),
+            )
+            tabbar.tag_bind(tab_id, "<Button-1>", lambda _e, t=tab_id: self.show_tab(t))
+            x += w
 
-            self._tab_buttons[tab_id] = btn
-            self._tab_underlines[tab_id] = underline
+        tabbar.tag_bind("tab", "<Enter>", lambda _e: tabbar.configure(cursor="hand2"))
+        tabbar.tag_bind("tab", "<Leave>", lambda _e: tabbar.configure(cursor=""))
 
-        # Default tab
+        # Default tab (all tabs start in the inactive style)
+        self._styled_tab = None
         self._active_tab = "monitors"
         self.show_tab(self._active_tab)
 
     def show_tab(self, tab_id: str) -> None:
         """Show a tab page and update the TSX-like tab styling."""
-        if not hasattr(self, "_tabs") or tab_id not in self._tabs:
+        if self._tabs is None:
             return
+        if tab_id not in self._tabs:
+            factory = self._tab_factories.pop(tab_id, None)
+            if factory is None:
+                return
+            self._tabs[tab_id] = factory(self._tab_stack)
 
         self._active_tab = tab_id
 
@@ -648,72 +881,86 @@ class InfinitePIPModernUI:
         except Exception:
             pass
 
-        # Update tab visuals
-        for tid, btn in getattr(self, "_tab_buttons", {}).items():
-            is_active = tid == tab_id
+        # Update tab visuals: only the outgoing and incoming tabs change.
+        tabbar = self._tabbar_canvas
+        previous = self._styled_tab
+        if tabbar is not None and previous != tab_id:
             try:
-                btn.configure(
-                    fg=self.colors["accent_primary"] if is_active else self.colors["text_secondary"],
-                    font=("Segoe UI", 10, "bold") if is_active else ("Segoe UI", 10),
+                if previous is not None:
+                    tabbar.itemconfigure(
+                        f"tablabel&&{previous}", fill=self.colors.text_secondary, font=_FONT_BODY
+                    )
+                    tabbar.itemconfigure(f"tabline&&{previous}", fill=self.colors.bg_secondary)
+                tabbar.itemconfigure(
+                    f"tablabel&&{tab_id}", fill=self.colors.accent_primary, font=_FONT_BODY_BOLD
                 )
+                tabbar.itemconfigure(f"tabline&&{tab_id}", fill=self.colors.accent_primary)
+                self._styled_tab = tab_id
             except Exception:
                 pass
-            ul = self._tab_underlines.get(tid)
-            if ul is not None:
-                try:
-                    ul.configure(bg=self.colors["accent_primary"] if is_active else self.colors["bg_secondary"])
-                except Exception:
-                    pass
 
     def create_monitors_tab(self, parent):
         """Create monitors tab with scrollable content"""
         # Main frame for monitors
-        monitors_frame = tk.Frame(parent, bg=self.colors["bg_primary"])
+        monitors_frame = tk.Frame(parent, bg=self.colors.bg_primary)
         monitors_frame.grid(row=0, column=0, sticky="nsew")
         monitors_frame.grid_rowconfigure(0, weight=1)
         monitors_frame.grid_columnconfigure(0, weight=1)
 
         # Add padding frame
-        padded_frame = tk.Frame(monitors_frame, bg=self.colors["bg_primary"])
+        padded_frame = tk.Frame(monitors_frame, bg=self.colors.bg_primary)
         padded_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
 
         # Section title
         title_label = tk.Label(
             padded_frame,
             text="Available Monitors",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 18, "bold"),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_primary,
+            font=_FONT_SECTION_TITLE,
         )
         title_label.pack(anchor=tk.W, pady=(0, 6))
 
         subtitle_label = tk.Label(
             padded_frame,
             text="Create picture-in-picture windows from any connected monitor",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_secondary,
+            font=_FONT_BODY,
         )
         subtitle_label.pack(anchor=tk.W, pady=(0, 18))
 
         # Create scrollable area
         scrollable_area = ModernScrollableFrame(padded_frame)
         scrollable_area.pack(fill=tk.BOTH, expand=True)
-        scrollable_area.configure_canvas(background=self.colors["bg_primary"])
+        scrollable_area.configure_canvas(background=self.colors.bg_primary)
         try:
             scrollable_area.scrollable_frame.configure(style="Modern.TFrame")
         except Exception:
             pass
 
         # Create grid container
-        grid_container = tk.Frame(scrollable_area.scrollable_frame, bg=self.colors["bg_primary"])
+        grid_container = tk.Frame(scrollable_area.scrollable_frame, bg=self.colors.bg_primary)
         grid_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Build cards once; grid them responsively based on available width.
         self._monitors_grid_container = grid_container
         self._monitor_cards = []
         self._monitor_columns_current = None
-        self._monitor_layout_after_id = None
+        self._monitor_cards_placed_count = 0
+        self._monitor_layout_pending = False
+        self._monitors_scroll_area = scrollable_area
+        self._monitor_preview_check_pending = False
+
+        # Previews are only captured once a card scrolls into view.
+        canvas = scrollable_area.canvas
+        scrollbar_set = scrollable_area.scrollbar.set
+
+        def _on_yscroll(first, last):
+            scrollbar_set(first, last)
+            self._schedule_visible_monitor_previews()
+
+        canvas.configure(yscrollcommand=_on_yscroll)
 
         for i, monitor in enumerate(self.monitors):
             card = self._create_monitor_card_widget(grid_container, monitor, i)
@@ -726,19 +973,52 @@ class InfinitePIPModernUI:
 
         return monitors_frame
 
+    def _rebuild_monitor_cards(self):
+        """Recreate the monitor cards from self.monitors (fresh previews, added/removed monitors)."""
+        container = self._monitors_grid_container
+        if container is None:
+            return
+        for card in self._monitor_cards:
+            card.destroy()
+        self._monitor_cards = [
+            self._create_monitor_card_widget(container, monitor, i)
+            for i, monitor in enumerate(self.monitors)
+        ]
+        self._monitor_cards_placed_count = 0
+        self._layout_monitor_cards()
+
+    @staticmethod
+    def _format_monitor_display(monitors):
+        """Pre-format the card label strings for each monitor (fixed until the next refresh)."""
+        display = []
+        for i, monitor in enumerate(monitors):
+            num_text = f"Monitor {i + 1}"
+            if monitor.is_primary:
+                num_text += " (Primary)"
+            aspect_ratio = round(monitor.width / monitor.height, 2)
+            display.append(
+                (
+                    num_text,
+                    f"Resolution: {monitor.width}×{monitor.height}",
+                    f"Aspect Ratio: {aspect_ratio}:1",
+                    f"Position: ({monitor.x}, {monitor.y})",
+                )
+            )
+        return display
+
     def _create_monitor_card_widget(self, parent, monitor, index):
         """Create a modern monitor card widget (positioned later by responsive grid)."""
         # Use ModernCard for exact Tailwind-like border behavior.
         card_container = ModernCard(
             parent,
-            padding=16,
-            bg=self.colors["bg_card"],
-            border=self.colors["border"],
-            border_hover=self.colors["accent_primary"],
+            **_CARD_FRAME_KW,
         )
+        # Set by _layout_monitor_cards / below; read without getattr.
+        card_container._grid_rc = None
+        card_container._preview_loader = None
 
         # Monitor icon and number (large)
-        icon_frame = tk.Frame(card_container.content_frame, bg=self.colors["bg_card"])
+        icon_frame = tk.Frame(card_container.content_frame, **_CARD_BG_KW)
         icon_frame.pack(pady=(0, 10), fill=tk.X)
 
         # Large monitor icon
@@ -746,95 +1026,79 @@ class InfinitePIPModernUI:
             icon_frame,
             text="🖥️",
             font=("Segoe UI", 28),
-            bg=self.colors["bg_card"],
-            fg=self.colors["accent_primary"],
+            bg=self.colors.bg_card,
+            fg=self.colors.accent_primary,
         )
         icon_label.pack()
 
         # Preview image
-        preview_frame = tk.Frame(icon_frame, bg=self.colors["bg_card"])
+        preview_frame = tk.Frame(icon_frame, **_CARD_BG_KW)
         preview_frame.pack(pady=(5, 0))
 
-        try:
-            # Capture preview screenshot
-            preview_image = self.capture_monitor_preview(index)
-            if preview_image:
-                # Resize to thumbnail
-                preview_image = preview_image.resize((120, 68), Image.Resampling.LANCZOS)
-                preview_photo = ImageTk.PhotoImage(preview_image)
-
-                preview_label = tk.Label(preview_frame, image=preview_photo, bg=self.colors["bg_card"])
-                preview_label.image = preview_photo  # Keep a reference
-                preview_label.pack()
-            else:
-                tk.Label(
-                    preview_frame,
-                    text="Preview unavailable",
-                    font=("Segoe UI", 8),
-                    bg=self.colors["bg_card"],
-                    fg=self.colors["text_muted"],
-                ).pack()
-        except Exception:
-            tk.Label(
+        key = (index, 120, 68, monitor.width, monitor.height)
+        preview_photo = self._monitor_preview_cache.get(key)
+        if preview_photo:
+            preview_label = tk.Label(preview_frame, image=preview_photo, bg=self.colors.bg_card)
+            self._keep_photo(preview_label, preview_photo)
+            preview_label.pack()
+        else:
+            # Placeholder until the card is first visible (see _load_visible_monitor_previews).
+            preview_label = tk.Label(
                 preview_frame,
-                text="Preview unavailable",
-                font=("Segoe UI", 8),
-                bg=self.colors["bg_card"],
-                fg=self.colors["text_muted"],
-            ).pack()
-
-        # Monitor number
-        monitor_num = index + 1
-        num_text = f"Monitor {monitor_num}"
-        if monitor.is_primary:
-            num_text += " (Primary)"
+                **_CARD_LOADING_KW,
+            )
+            preview_label.pack()
+            card_container._preview_loader = functools.partial(
+                self._request_monitor_preview, preview_label, index, key
+            )
+
+        num_text, res_text, aspect_text, pos_text = self._monitor_display[index]
 
         num_label = tk.Label(
             icon_frame,
             text=num_text,
-            font=("Segoe UI", 12, "bold"),
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_primary"],
+            font=_FONT_CARD_TITLE,
+            bg=self.colors.bg_card,
+            fg=self.colors.text_primary,
         )
         num_label.pack(pady=(5, 0))
 
         # Monitor specs (compact)
-        specs_frame = tk.Frame(card_container.content_frame, bg=self.colors["bg_card"])
+        specs_frame = tk.Frame(card_container.content_frame, **_CARD_BG_KW)
         specs_frame.pack(pady=(0, 10), fill=tk.X)
 
         # Resolution (main info)
         resolution_label = tk.Label(
             specs_frame,
-            text=f"Resolution: {monitor.width}×{monitor.height}",
-            font=("Segoe UI", 10),
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_secondary"],
+            text=res_text,
+            font=_FONT_BODY,
+            bg=self.colors.bg_card,
+            fg=self.colors.text_secondary,
         )
         resolution_label.pack()
 
         # Aspect ratio
-        aspect_ratio = round(monitor.width / monitor.height, 2)
         aspect_label = tk.Label(
             specs_frame,
-            text=f"Aspect Ratio: {aspect_ratio}:1",
-            font=("Segoe UI", 10),
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_secondary"],
+            text=aspect_text,
+            font=_FONT_BODY,
+            bg=self.colors.bg_card,
+            fg=self.colors.text_secondary,
         )
         aspect_label.pack()
 
         # Position (smaller)
         position_label = tk.Label(
             specs_frame,
-            text=f"Position: ({monitor.x}, {monitor.y})",
-            font=("Segoe UI", 10),
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_secondary"],
+            text=pos_text,
+            font=_FONT_BODY,
+            bg=self.colors.bg_card,
+            fg=self.colors.text_secondary,
         )
         position_label.pack(pady=(2, 0))
 
         # Action button (full width)
-        button_frame = tk.Frame(card_container.content_frame, bg=self.colors["bg_card"])
+        button_frame = tk.Frame(card_container.content_frame, **_CARD_BG_KW)
         button_frame.pack(fill=tk.X)
 
         create_button = ModernButton(
@@ -847,27 +1111,125 @@ class InfinitePIPModernUI:
 
         return card_container
 
-    def _schedule_layout_monitor_cards(self, _event=None):
-        """Debounce monitor card relayout (called on resize/configure events)."""
+    def _request_monitor_preview(self, label, index, key):
+        """Capture a monitor thumbnail off the Tk thread; `label` is filled in when it arrives."""
+        try:
+            future = self._capture_pool.submit(self._capture_monitor_thumbnail, index)
+            future.add_done_callback(
+                lambda f, lbl=label, k=key: self._post_preview(self._apply_monitor_preview, lbl, k, f)
+            )
+        except Exception:
+            label.configure(**self._PREVIEW_UNAVAIL_KW)
+
+    def _schedule_visible_monitor_previews(self):
+        """Coalesce scroll/layout changes into one visibility pass once geometry settles."""
+        if self._monitor_preview_check_pending:
+            return
+        self._monitor_preview_check_pending = True
+        self.root.after_idle(self._load_visible_monitor_previews)
+
+    def _load_visible_monitor_previews(self):
+        """Start preview captures for monitor cards inside the scroll viewport."""
+        self._monitor_preview_check_pending = False
+        area = self._monitors_scroll_area
+        if area is None:
+            return
+        try:
+            content_height = area.scrollable_frame.winfo_height()
+            if content_height <= 1:
+                return  # not laid out yet; the first <Configure> retries
+            top, bottom = area.canvas.yview()
+            view_top = top * content_height
+            view_bottom = bottom * content_height
+            offset = self._monitors_grid_container.winfo_y()
+            for card in self._monitor_cards:
+                loader = card._preview_loader
+                if loader is None or card._grid_rc is None:
+                    continue
+                card_top = offset + card.winfo_y()
+                if card_top < view_bottom and card_top + card.winfo_height() > view_top:
+                    card._preview_loader = None
+                    loader()
+        except Exception:
+            pass
+
+    def _capture_monitor_thumbnail(self, index):
+        """Capture and downscale a monitor preview (worker thread; must not touch Tk)."""
+        preview_image = self.capture_monitor_preview(index)
+        if not preview_image:
+            return None
+        return _make_thumbnail(preview_image, (120, 68))
+
+    def _post_preview(self, apply, label, key, future):
+        """Worker callback: hand a finished thumbnail to `apply` on the Tk thread."""
+        if self.is_closing:
+            return
+        try:
+            image = future.result()
+        except Exception:
+            image = None
+        try:
+            self.root.after(0, apply, label, key, image)
+        except Exception:
+            pass
+
+    def _apply_monitor_preview(self, label, key, image):
+        """Install a monitor thumbnail into its card (Tk thread: PhotoImage needs it)."""
         try:
-            if self._monitor_layout_after_id:
-                self.root.after_cancel(self._monitor_layout_after_id)
+            if image is None:
+                if label.winfo_exists():
+                    label.configure(**self._PREVIEW_UNAVAIL_KW)
+                return
+            photo = ImageTk.PhotoImage(image)
+            self._monitor_preview_cache[key] = photo
+            if label.winfo_exists():
+                label.configure(image=photo, text="")
+                self._keep_photo(label, photo)
         except Exception:
             pass
-        self._monitor_layout_after_id = self.root.after(50, self._layout_monitor_cards)
+
+    def _schedule_layout_monitor_cards(self, _event=None):
+        """Debounce monitor card relayout (called on resize/configure events)."""
+        # No-op resize: the column count this width maps to is already applied.
+        if (
+            _event is not None
+            and _event.widget is self._monitors_grid_container
+            and self._monitor_columns_for_width(_event.width) == self._monitor_columns_current
+        ):
+            return
+        # Coalesce a burst of events into one layout once the event queue drains.
+        if self._monitor_layout_pending:
+            return
+        self._monitor_layout_pending = True
+        self.root.after_idle(self._run_monitor_layout)
+
+    def _run_monitor_layout(self):
+        """Idle callback for `_schedule_layout_monitor_cards`."""
+        self._monitor_layout_pending = False
+        self._layout_monitor_cards()
+
+    @staticmethod
+    def _monitor_columns_for_width(width):
+        """Column count for the monitor grid at a given container width."""
+        min_card_width = 300
+        gap = 16
+        return max(1, min(4, (width + gap) // (min_card_width + gap)))
 
     def _layout_monitor_cards(self):
         """Responsive grid: choose column count based on available width."""
-        if not hasattr(self, "_monitors_grid_container"):
+        if self._monitors_grid_container is None:
             return
         parent = self._monitors_grid_container
         width = parent.winfo_width()
         if width <= 1:
             return
 
-        min_card_width = 300
-        gap = 16
-        columns = max(1, min(4, (width + gap) // (min_card_width + gap)))
+        columns = self._monitor_columns_for_width(width)
+        cards = self._monitor_cards
+
+        # Same column count and same cards: every card is already in its cell.
+        if columns == self._monitor_columns_current and len(cards) == self._monitor_cards_placed_count:
+            return
 
         if columns != self._monitor_columns_current:
             # Reset column weights
@@ -877,33 +1239,38 @@ class InfinitePIPModernUI:
                 parent.grid_columnconfigure(c, weight=1, uniform="monitor")
             self._monitor_columns_current = columns
 
-        # Grid cards
-        for i, card in enumerate(getattr(self, "_monitor_cards", [])):
-            row = i // columns
-            col = i % columns
-            card.grid(row=row, column=col, sticky="nsew", padx=8, pady=8)
+        # Grid cards (only those whose cell actually changed)
+        for i, card in enumerate(cards):
+            rc = (i // columns, i % columns)
+            if card._grid_rc != rc:
+                card.grid(row=rc[0], column=rc[1], sticky="nsew", padx=8, pady=8)
+                card._grid_rc = rc
+        self._monitor_cards_placed_count = len(cards)
+
+        # Cards may have moved into the viewport.
+        self._schedule_visible_monitor_previews()
 
     def create_windows_tab(self, parent):
         """Create windows tab with scrollable content"""
-        windows_frame = tk.Frame(parent, bg=self.colors["bg_primary"])
+        windows_frame = tk.Frame(parent, bg=self.colors.bg_primary)
         windows_frame.grid(row=0, column=0, sticky="nsew")
         windows_frame.grid_rowconfigure(0, weight=1)
         windows_frame.grid_columnconfigure(0, weight=1)
 
         # Add padding frame
-        padded_frame = tk.Frame(windows_frame, bg=self.colors["bg_primary"])
+        padded_frame = tk.Frame(windows_frame, bg=self.colors.bg_primary)
         padded_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
 
         # Section header
-        header_frame = tk.Frame(padded_frame, bg=self.colors["bg_primary"])
+        header_frame = tk.Frame(padded_frame, bg=self.colors.bg_primary)
         header_frame.pack(fill=tk.X, pady=(0, 20))
 
         title_label = tk.Label(
             header_frame,
             text="Application Windows",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 18, "bold"),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_primary,
+            font=_FONT_SECTION_TITLE,
         )
         title_label.pack(side=tk.LEFT, anchor=tk.W)
 
@@ -915,55 +1282,130 @@ class InfinitePIPModernUI:
         subtitle_label = tk.Label(
             padded_frame,
             text="Capture and display content from any application window",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_secondary,
+            font=_FONT_BODY,
         )
         subtitle_label.pack(anchor=tk.W, pady=(0, 20))
 
         # Create scrollable area
         scrollable_area = ModernScrollableFrame(padded_frame)
         scrollable_area.pack(fill=tk.BOTH, expand=True)
-        scrollable_area.configure_canvas(background=self.colors["bg_primary"])
+        scrollable_area.configure_canvas(background=self.colors.bg_primary)
 
         # Window list container
         self.windows_container = scrollable_area.scrollable_frame
+        self._windows_scroll_area = scrollable_area
+        self._windows_list_body = None  # current card frame (see update_windows_list)
+        self._windows_cards_body = None  # set while the body holds cards (not the empty state)
+        self._window_card_index = {}  # hwnd -> (card, (bbox, title)) for card reuse
         self.update_windows_list()
         return windows_frame
 
     def update_windows_list(self):
         """Update the windows list with current windows"""
-        # Clear existing widgets
-        for widget in self.windows_container.winfo_children():
-            widget.destroy()
+        self._prune_photo_refs()
 
         if not self.windows:
+            body = ttk.Frame(self.windows_container)
             no_windows_label = ttk.Label(
-                self.windows_container,
+                body,
                 text="No windows found. Click 'Refresh' to update the list.",
-                style="ModernText.TLabel",
-                foreground=self.colors["text_muted"],
+                **_TEXT_LABEL_KW,
+                foreground=self.colors.text_muted,
             )
             no_windows_label.pack(pady=20)
+            self._swap_list_body("_windows_list_body", body)
+            self._windows_cards_body = None
+            self._window_card_index = {}
             return
 
-        # Create window cards
-        for i, window in enumerate(self.windows):
-            self.create_window_card(self.windows_container, window, i)
+        body = self._windows_cards_body
+        if body is None:
+            # Coming from the empty state (or first build): start a fresh card frame.
+            body = ttk.Frame(self.windows_container)
+            self._swap_list_body("_windows_list_body", body)
+            self._windows_cards_body = body
+            self._window_card_index = {}
 
-    def create_window_card(self, parent, window, index):
+        # Hold scroll-region updates until every card is in place.
+        self._windows_scroll_area.suspend_scrollregion()
+        try:
+            # Reuse cards (and their thumbnails) for windows whose size/position/title are
+            # unchanged; only new or changed windows are rebuilt and recaptured.
+            old_index = self._window_card_index
+            new_index = {}
+            ordered = []
+            for window in self.windows:
+                hwnd = window.get("hwnd")
+                sig = (window.get("bbox"), window.get("title"))
+                entry = old_index.pop(hwnd, None) if hwnd is not None else None
+                if entry is not None and entry[1] == sig:
+                    card = entry[0]
+                else:
+                    if entry is not None:
+                        entry[0].destroy()
+                    card = self.create_window_card(body, window)
+                if hwnd is not None:
+                    new_index[hwnd] = (card, sig)
+                ordered.append(card)
+
+            # Anything not claimed above is gone (or had no hwnd to match on).
+            claimed = set(ordered)
+            for child in body.winfo_children():
+                if child not in claimed:
+                    child.destroy()
+            self._window_card_index = new_index
+
+            # Re-pack only if the order changed.
+            if body.pack_slaves() != ordered:
+                for card in ordered:
+                    card.pack_forget()
+                for card in ordered:
+                    card.pack(fill=tk.X, pady=8, padx=5)
+        finally:
+            self._windows_scroll_area.resume_scrollregion()
+
+    def _keep_photo(self, label, photo):
+        """Keep `photo` alive for as long as `label` displays it."""
+        self._photo_refs[str(label)] = photo
+
+    def _prune_photo_refs(self):
+        """Drop PhotoImage references whose labels have been destroyed."""
+        call = self.root.tk.call
+        getboolean = self.root.getboolean
+        self._photo_refs = {
+            path: photo
+            for path, photo in self._photo_refs.items()
+            if getboolean(call("winfo", "exists", path))
+        }
+
+    def _swap_list_body(self, attr, body):
+        """Show `body` in place of the list frame stored in `attr` (None just clears it).
+
+        Destroying the old frame tears down all of its cards in one Tk call instead of
+        one destroy (and relayout) per card.
+        """
+        old = getattr(self, attr)
+        if body is not None:
+            body.pack(fill=tk.BOTH, expand=True)
+        setattr(self, attr, body)
+        if old is not None:
+            try:
+                old.destroy()
+            except Exception:
+                pass
+
+    def create_window_card(self, parent, window):
         """Create a modern window card"""
         card = ModernCard(
             parent,
-            padding=16,
-            bg=self.colors["bg_card"],
-            border=self.colors["border"],
-            border_hover=self.colors["accent_primary"],
+            **_CARD_FRAME_KW,
         )
         card.pack(fill=tk.X, pady=8, padx=5)
 
         # Window title and details
-        title_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        title_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         title_frame.pack(fill=tk.X, pady=(0, 15))
 
         # Window icon and title
@@ -974,46 +1416,39 @@ class InfinitePIPModernUI:
         title_label = tk.Label(
             title_frame,
             text=f"{window_title}",
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 12, "bold"),
+            **_CARD_TITLE_KW,
         )
         title_label.pack(anchor=tk.W)
 
         # Preview image
-        preview_frame = tk.Frame(title_frame, bg=self.colors["bg_card"])
+        preview_frame = tk.Frame(title_frame, **_CARD_BG_KW)
         preview_frame.pack(anchor=tk.W, pady=(8, 0))
 
-        try:
-            # Capture preview screenshot
-            preview_image = self.capture_window_preview(window)
-            if preview_image:
-                # Resize to thumbnail
-                preview_image = preview_image.resize((120, 68), Image.Resampling.LANCZOS)
-                preview_photo = ImageTk.PhotoImage(preview_image)
-
-                preview_label = tk.Label(preview_frame, image=preview_photo, bg=self.colors["bg_card"])
-                preview_label.image = preview_photo  # Keep a reference
-                preview_label.pack()
-            else:
-                tk.Label(
-                    preview_frame,
-                    text="Preview unavailable",
-                    font=("Segoe UI", 8),
-                    bg=self.colors["bg_card"],
-                    fg=self.colors["text_muted"],
-                ).pack()
-        except Exception:
-            tk.Label(
+        key = self._window_preview_key(window)
+        preview_photo = self._get_cached_window_preview(key)
+        if preview_photo:
+            preview_label = tk.Label(preview_frame, image=preview_photo, bg=self.colors.bg_card)
+            self._keep_photo(preview_label, preview_photo)
+            preview_label.pack()
+        else:
+            # Capture off the Tk thread; the label is filled in when the thumbnail arrives.
+            preview_label = tk.Label(
                 preview_frame,
-                text="Preview unavailable",
-                font=("Segoe UI", 8),
-                bg=self.colors["bg_card"],
-                fg=self.colors["text_muted"],
-            ).pack()
+                **_CARD_LOADING_KW,
+            )
+            preview_label.pack()
+            try:
+                future = self._capture_pool.submit(self._capture_window_thumbnail, window)
+                future.add_done_callback(
+                    lambda f, lbl=preview_label, k=key: self._post_preview(
+                        self._apply_window_preview, lbl, k, f
+                    )
+                )
+            except Exception:
+                preview_label.configure(**self._PREVIEW_UNAVAIL_KW)
 
         # Window specs
-        specs_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        specs_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         specs_frame.pack(fill=tk.X, pady=(0, 15))
 
         if "bbox" in window:
@@ -1021,56 +1456,103 @@ class InfinitePIPModernUI:
             size_label = tk.Label(
                 specs_frame,
                 text=f"Size: {bbox[2]}×{bbox[3]} • Position: ({bbox[0]}, {bbox[1]})",
-                bg=self.colors["bg_card"],
-                fg=self.colors["text_secondary"],
-                font=("Segoe UI", 10),
+                **_CARD_SPEC_KW,
             )
             size_label.pack(anchor=tk.W)
 
         # Action button
-        button_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        button_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         button_frame.pack(anchor=tk.W)
 
         create_button = ModernButton(
             button_frame,
             text="Create PIP",
-            command=lambda idx=index: self.create_window_pip(idx),
+            command=lambda key=self._window_key(window): self.create_window_pip(key),
             style_type="primary",
         )
         create_button.pack(side=tk.LEFT)
 
+        return card
+
+    def _window_preview_key(self, window):
+        """Cache key for a window thumbnail: a resize invalidates it."""
+        bbox = window.get("bbox") or (0, 0, 0, 0)
+        hwnd = window.get("hwnd")
+        if hwnd is None:
+            # pygetwindow entries have no handle; title + position tell them apart.
+            return (None, window.get("title"), bbox[0], bbox[1], bbox[2], bbox[3])
+        return (hwnd, bbox[2], bbox[3])
+
+    def _get_cached_window_preview(self, key):
+        """Return a cached window thumbnail if it is recent enough, else None."""
+        cache = self._window_preview_cache
+        entry = cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= _WINDOW_PREVIEW_TTL:
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+    def _capture_window_thumbnail(self, window):
+        """Capture and downscale a window preview (worker thread; must not touch Tk)."""
+        preview_image = self.capture_window_preview(window, (120, 68))
+        if not preview_image:
+            return None
+        if preview_image.size != (120, 68):
+            # Region fallback returns full resolution
+            preview_image = _make_thumbnail(preview_image, (120, 68))
+        return preview_image
+
+    def _apply_window_preview(self, label, key, image):
+        """Cache a window thumbnail and install it into its card (Tk thread)."""
+        try:
+            if image is None:
+                if label.winfo_exists():
+                    label.configure(**self._PREVIEW_UNAVAIL_KW)
+                return
+            photo = ImageTk.PhotoImage(image)
+            cache = self._window_preview_cache
+            cache[key] = (time.monotonic(), photo)
+            cache.move_to_end(key)
+            while len(cache) > _WINDOW_PREVIEW_CACHE_SIZE:
+                cache.popitem(last=False)
+            if label.winfo_exists():
+                label.configure(image=photo, text="")
+                self._keep_photo(label, photo)
+        except Exception:
+            pass
+
     def create_regions_tab(self, parent):
         """Create regions tab with custom region definition"""
-        regions_frame = tk.Frame(parent, bg=self.colors["bg_primary"])
+        regions_frame = tk.Frame(parent, bg=self.colors.bg_primary)
         regions_frame.grid(row=0, column=0, sticky="nsew")
         regions_frame.grid_rowconfigure(0, weight=1)
         regions_frame.grid_columnconfigure(0, weight=1)
 
         # Add padding frame
-        padded_frame = tk.Frame(regions_frame, bg=self.colors["bg_primary"])
+        padded_frame = tk.Frame(regions_frame, bg=self.colors.bg_primary)
         padded_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
 
         # Section title
         title_label = tk.Label(
             padded_frame,
             text="Custom Screen Regions",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 18, "bold"),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_primary,
+            font=_FONT_SECTION_TITLE,
         )
         title_label.pack(anchor=tk.W, pady=(0, 6))
 
         subtitle_label = tk.Label(
             padded_frame,
             text="Define custom screen areas to capture",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_secondary,
+            font=_FONT_BODY,
         )
         subtitle_label.pack(anchor=tk.W, pady=(0, 18))
 
         # Two-column layout (TSX: config + preview side-by-side on large screens)
-        cards_container = tk.Frame(padded_frame, bg=self.colors["bg_primary"])
+        cards_container = tk.Frame(padded_frame, bg=self.colors.bg_primary)
         cards_container.pack(fill=tk.BOTH, expand=True)
         cards_container.grid_columnconfigure(0, weight=1, uniform="regions")
         cards_container.grid_columnconfigure(1, weight=1, uniform="regions")
@@ -1080,28 +1562,23 @@ class InfinitePIPModernUI:
         # Create input card
         input_card = ModernCard(
             cards_container,
-            padding=16,
-            bg=self.colors["bg_card"],
-            border=self.colors["border"],
-            border_hover=self.colors["accent_primary"],
+            **_CARD_FRAME_KW,
         )
         self._regions_input_card = input_card
 
         # Responsive input grid (reflows on narrow widths)
-        self._region_fields_container = tk.Frame(input_card.content_frame, bg=self.colors["bg_card"])
+        self._region_fields_container = tk.Frame(input_card.content_frame, **_CARD_BG_KW)
         self._region_fields_container.pack(fill=tk.X)
         self._region_field_frames = []
 
         def _make_field(label: str, default: str):
-            frame = tk.Frame(self._region_fields_container, bg=self.colors["bg_card"])
+            frame = tk.Frame(self._region_fields_container, **_CARD_BG_KW)
             tk.Label(
                 frame,
                 text=label,
-                bg=self.colors["bg_card"],
-                fg=self.colors["text_secondary"],
-                font=("Segoe UI", 10),
+                **_CARD_SPEC_KW,
             ).pack(anchor=tk.W)
-            entry = ttk.Entry(frame, width=1, style="Modern.TEntry")
+            entry = ttk.Entry(frame, width=1, **_ENTRY_KW)
             entry.pack(fill=tk.X, expand=True, pady=(5, 0))
             entry.insert(0, default)
             return frame, entry
@@ -1113,33 +1590,33 @@ class InfinitePIPModernUI:
         self._region_field_frames = [x_frame, y_frame, w_frame, h_frame]
 
         self._region_fields_columns_current = None
+        self._region_fields_placed_count = 0
+        self._region_fields_map_bind_id = None
+        self._region_fields_pending = False
         self._layout_region_fields()
         self._region_fields_container.bind("<Configure>", self._schedule_layout_region_fields, add="+")
 
         # Preview section
         preview_card = ModernCard(
             cards_container,
-            padding=16,
-            bg=self.colors["bg_card"],
-            border=self.colors["border"],
-            border_hover=self.colors["accent_primary"],
+            **_CARD_FRAME_KW,
         )
         self._regions_preview_card = preview_card
 
         tk.Label(
             preview_card.content_frame,
             text="📷 Region Preview",
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 12, "bold"),
+            **_CARD_TITLE_KW,
         ).pack(anchor=tk.W)
 
         # Preview image container
-        self.region_preview_container = tk.Frame(preview_card.content_frame, bg=self.colors["bg_card"])
+        self.region_preview_container = tk.Frame(preview_card.content_frame, **_CARD_BG_KW)
         self.region_preview_container.pack(anchor=tk.W, pady=(15, 0))
+        self._region_input_error_label = None
+        self._region_preview_inner = None  # swapped wholesale on each update
 
         # Preview button
-        preview_button_frame = tk.Frame(preview_card.content_frame, bg=self.colors["bg_card"])
+        preview_button_frame = tk.Frame(preview_card.content_frame, **_CARD_BG_KW)
         preview_button_frame.pack(anchor=tk.W, pady=(15, 0))
 
         preview_button = ModernButton(
@@ -1151,7 +1628,7 @@ class InfinitePIPModernUI:
         preview_button.pack(side=tk.LEFT)
 
         # Create button
-        button_frame = tk.Frame(input_card.content_frame, bg=self.colors["bg_card"])
+        button_frame = tk.Frame(input_card.content_frame, **_CARD_BG_KW)
         button_frame.pack(anchor=tk.W, pady=(20, 0))
 
         create_button = ModernButton(
@@ -1166,25 +1643,25 @@ class InfinitePIPModernUI:
 
     def create_active_pips_tab(self, parent):
         """Create active PIPs management tab"""
-        active_frame = tk.Frame(parent, bg=self.colors["bg_primary"])
+        active_frame = tk.Frame(parent, bg=self.colors.bg_primary)
         active_frame.grid(row=0, column=0, sticky="nsew")
         active_frame.grid_rowconfigure(0, weight=1)
         active_frame.grid_columnconfigure(0, weight=1)
 
         # Add padding frame
-        padded_frame = tk.Frame(active_frame, bg=self.colors["bg_primary"])
+        padded_frame = tk.Frame(active_frame, bg=self.colors.bg_primary)
         padded_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
 
         # Section header
-        header_frame = tk.Frame(padded_frame, bg=self.colors["bg_primary"])
+        header_frame = tk.Frame(padded_frame, bg=self.colors.bg_primary)
         header_frame.pack(fill=tk.X, pady=(0, 20))
 
         title_label = tk.Label(
             header_frame,
             text="Active PIP Windows",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 18, "bold"),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_primary,
+            font=_FONT_SECTION_TITLE,
         )
         title_label.pack(side=tk.LEFT, anchor=tk.W)
 
@@ -1193,133 +1670,181 @@ class InfinitePIPModernUI:
         )
         close_all_button.pack(side=tk.RIGHT)
         self._close_all_button = close_all_button
+        self._close_all_visible = True
 
         subtitle_label = tk.Label(
             padded_frame,
             text="Manage all active picture-in-picture windows",
-            bg=self.colors["bg_primary"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            bg=self.colors.bg_primary,
+            fg=self.colors.text_secondary,
+            font=_FONT_BODY,
         )
         subtitle_label.pack(anchor=tk.W, pady=(0, 20))
 
         # Create scrollable area
         scrollable_area = ModernScrollableFrame(padded_frame)
         scrollable_area.pack(fill=tk.BOTH, expand=True)
-        scrollable_area.configure_canvas(background=self.colors["bg_primary"])
+        scrollable_area.configure_canvas(background=self.colors.bg_primary)
 
         # Active PIPs container
         self.active_pips_container = scrollable_area.scrollable_frame
+        self._pips_scroll_area = scrollable_area
+
+        # Empty-state placeholder is created once and toggled with pack/pack_forget.
+        self._no_pips_label = ttk.Label(
+            self.active_pips_container,
+            text="No active PIPs. Create one from the other tabs.",
+            **_TEXT_LABEL_KW,
+            foreground=self.colors.text_muted,
+        )
+        self._no_pips_visible = False
+        self._pips_list_body = None  # current card frame (see update_active_pips_list)
+        self._pip_card_index = {}  # pip -> (card, signature) for card reuse
         self.update_active_pips_list()
         return active_frame
 
     def update_active_pips_list(self):
         """Update the active PIPs list"""
-        # Clear existing widgets
-        for widget in self.active_pips_container.winfo_children():
-            widget.destroy()
+        # Tab not built yet: it renders the current list when first shown.
+        if self.active_pips_container is None:
+            return
 
         if not self.active_pips:
-            no_pips_label = ttk.Label(
-                self.active_pips_container,
-                text="No active PIPs. Create one from the other tabs.",
-                style="ModernText.TLabel",
-                foreground=self.colors["text_muted"],
-            )
-            no_pips_label.pack(pady=20)
+            self._swap_list_body("_pips_list_body", None)
+            self._pip_card_index = {}
+            if not self._no_pips_visible:
+                self._no_pips_label.pack(pady=20)
+                self._no_pips_visible = True
             self._update_close_all_visibility()
             return
 
-        # Create PIP cards
-        for i, pip in enumerate(self.active_pips):
-            self.create_pip_card(self.active_pips_container, pip, i)
+        if self._no_pips_visible:
+            self._no_pips_label.pack_forget()
+            self._no_pips_visible = False
+
+        body = self._pips_list_body
+        if body is None:
+            body = ttk.Frame(self.active_pips_container)
+            self._swap_list_body("_pips_list_body", body)
+            self._pip_card_index = {}
+
+        self._pips_scroll_area.suspend_scrollregion()
+        try:
+            # Reuse the cards of PIPs whose displayed details are unchanged; a single
+            # open/close then only creates or destroys one card.
+            old_index = self._pip_card_index
+            new_index = {}
+            ordered = []
+            for pip in self.active_pips:
+                sig = self._pip_card_signature(pip)
+                entry = old_index.pop(pip, None)
+                if entry is not None and entry[1] == sig:
+                    card = entry[0]
+                else:
+                    if entry is not None:
+                        entry[0].destroy()
+                    card = self.create_pip_card(body, pip)
+                new_index[pip] = (card, sig)
+                ordered.append(card)
+
+            for card, _sig in old_index.values():
+                card.destroy()
+            self._pip_card_index = new_index
+
+            # Re-pack only if the order changed.
+            if body.pack_slaves() != ordered:
+                for card in ordered:
+                    card.pack_forget()
+                for card in ordered:
+                    card.pack(fill=tk.X, pady=8, padx=5)
+        finally:
+            self._pips_scroll_area.resume_scrollregion()
 
         self._update_close_all_visibility()
 
-    def create_pip_card(self, parent, pip, index):
+    @staticmethod
+    def _pip_card_signature(pip):
+        """Everything a PIP card displays; the card is rebuilt when this changes."""
+        size = pip.last_size if (pip.window and pip.running) else None
+        return (pip.get_source_name(), pip.source_type, size)
+
+    def create_pip_card(self, parent, pip):
         """Create a card for an active PIP"""
         card = ModernCard(
             parent,
-            padding=16,
-            bg=self.colors["bg_card"],
-            border=self.colors["border"],
-            border_hover=self.colors["accent_primary"],
+            **_CARD_FRAME_KW,
         )
         card.pack(fill=tk.X, pady=8, padx=5)
 
         # PIP title and details
-        title_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        title_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         title_frame.pack(fill=tk.X, pady=(0, 15))
 
         pip_title = pip.get_source_name()
         title_label = tk.Label(
             title_frame,
             text=pip_title,
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_primary"],
-            font=("Segoe UI", 12, "bold"),
+            **_CARD_TITLE_KW,
         )
         title_label.pack(anchor=tk.W)
 
         # PIP specs
-        specs_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        specs_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         specs_frame.pack(fill=tk.X, pady=(0, 15))
 
         source_type_label = tk.Label(
             specs_frame,
             text=f"Source Type: {pip.source_type}",
-            bg=self.colors["bg_card"],
-            fg=self.colors["text_secondary"],
-            font=("Segoe UI", 10),
+            **_CARD_SPEC_KW,
         )
         source_type_label.pack(anchor=tk.W)
 
-        if pip.window and pip.window.winfo_exists():
-            size_text = f"Size: {pip.window.winfo_width()}×{pip.window.winfo_height()}"
+        if pip.window and pip.running:
+            width, height = pip.last_size
+            size_text = f"Size: {width}×{height}"
             size_label = tk.Label(
                 specs_frame,
                 text=size_text,
-                bg=self.colors["bg_card"],
-                fg=self.colors["text_secondary"],
-                font=("Segoe UI", 10),
+                **_CARD_SPEC_KW,
             )
             size_label.pack(anchor=tk.W, pady=(2, 0))
 
         # Action button
-        button_frame = tk.Frame(card.content_frame, bg=self.colors["bg_card"])
+        button_frame = tk.Frame(card.content_frame, **_CARD_BG_KW)
         button_frame.pack(anchor=tk.W)
 
         close_button = ModernButton(
             button_frame, text="Close PIP", command=lambda p=pip: self.close_pip(p), style_type="danger"
         )
         close_button.pack(side=tk.LEFT)
+        return card
 
     def create_footer(self, parent):
         """Create footer with actions and info"""
-        footer_outer = tk.Frame(parent, bg=self.colors["bg_secondary"])
+        footer_outer = tk.Frame(parent, bg=self.colors.bg_secondary)
         footer_outer.grid(row=2, column=0, sticky="ew")
         footer_outer.grid_columnconfigure(0, weight=1)
 
         # Top border line (TSX: border-t border-gray-800)
-        tk.Frame(footer_outer, bg=self.colors["border"], height=1).grid(
+        tk.Frame(footer_outer, bg=self.colors.border, height=1).grid(
             row=0, column=0, sticky="ew"
         )
 
-        footer_content = tk.Frame(footer_outer, bg=self.colors["bg_secondary"])
+        footer_content = tk.Frame(footer_outer, bg=self.colors.bg_secondary)
         footer_content.grid(row=1, column=0, sticky="ew", padx=24, pady=14)
         footer_content.grid_columnconfigure(0, weight=1)
         footer_content.grid_columnconfigure(1, weight=0)
 
         # Left side - Info
-        info_frame = tk.Frame(footer_content, bg=self.colors["bg_secondary"])
+        info_frame = tk.Frame(footer_content, bg=self.colors.bg_secondary)
         info_frame.grid(row=0, column=0, sticky="w")
 
         info_text = "💡 PIPs stay on top, can be moved by dragging, and resized by dragging edges/corners"
         self._footer_info_label = tk.Label(
             info_frame,
             text=info_text,
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["text_secondary"],
+            bg=self.colors.bg_secondary,
+            fg=self.colors.text_secondary,
             font=("Segoe UI", 9),
             justify="left",
             wraplength=1,
@@ -1327,7 +1852,7 @@ class InfinitePIPModernUI:
         self._footer_info_label.grid(row=0, column=0, sticky="w")
 
         # Right side - Actions
-        actions_frame = tk.Frame(footer_content, bg=self.colors["bg_secondary"])
+        actions_frame = tk.Frame(footer_content, bg=self.colors.bg_secondary)
         actions_frame.grid(row=0, column=1, sticky="e")
 
         refresh_button = ModernButton(
@@ -1346,46 +1871,72 @@ class InfinitePIPModernUI:
             minimize_button.pack(side=tk.RIGHT, padx=(10, 0))
 
     def _on_root_resize(self, _event=None):
+        """Coalesce root <Configure> events (fired for every descendant) into one idle update."""
+        if self._root_resize_pending:
+            return
+        self._root_resize_pending = True
+        self.root.after_idle(self._apply_root_resize)
+
+    def _apply_root_resize(self):
         """Keep long labels readable on resize (prevents clipping/overlap)."""
+        self._root_resize_pending = False
         try:
             w = max(1, self.root.winfo_width())
         except Exception:
             return
 
         # Header subtitle wraps sooner to avoid running into the status column.
-        if hasattr(self, "_header_subtitle_label"):
+        if self._header_subtitle_label is not None:
             try:
                 self._header_subtitle_label.configure(wraplength=max(300, int(w * 0.55)))
             except Exception:
                 pass
 
         # Footer tip wraps based on available width.
-        if hasattr(self, "_footer_info_label"):
+        if self._footer_info_label is not None:
             try:
                 self._footer_info_label.configure(wraplength=max(380, int(w * 0.60)))
             except Exception:
                 pass
 
     def _schedule_layout_region_fields(self, _event=None):
-        try:
-            if hasattr(self, "_region_fields_after_id") and self._region_fields_after_id:
-                self.root.after_cancel(self._region_fields_after_id)
-        except Exception:
-            pass
-        self._region_fields_after_id = self.root.after(50, self._layout_region_fields)
+        """Coalesce region-field relayouts into one run once the event queue drains."""
+        if self._region_fields_pending:
+            return
+        self._region_fields_pending = True
+        self.root.after_idle(self._run_region_fields_layout)
+
+    def _run_region_fields_layout(self):
+        """Idle callback for `_schedule_layout_region_fields`."""
+        self._region_fields_pending = False
+        self._layout_region_fields()
+
+    def _layout_region_fields_once(self, _event=None):
+        """One-shot <Map> handler: run the first region-field layout, then unbind."""
+        bind_id = self._region_fields_map_bind_id
+        self._region_fields_map_bind_id = None
+        if bind_id is not None:
+            try:
+                self._region_fields_container.unbind("<Map>", bind_id)
+            except Exception:
+                pass
+        self._layout_region_fields()
 
     def _layout_region_fields(self):
         """Responsive region input layout: 4 columns wide, 2 columns medium, 1 column narrow."""
-        if not hasattr(self, "_region_fields_container"):
+        if self._region_fields_container is None:
             return
         container = self._region_fields_container
         width = container.winfo_width()
         if width <= 1:
-            # Not yet laid out; try later
-            try:
-                self.root.after(50, self._layout_region_fields)
-            except Exception:
-                pass
+            # Not yet laid out; let the first <Map> drive the initial layout.
+            if self._region_fields_map_bind_id is None:
+                try:
+                    self._region_fields_map_bind_id = container.bind(
+                        "<Map>", self._layout_region_fields_once, add="+"
+                    )
+                except Exception:
+                    pass
             return
 
         if width >= 760:
@@ -1395,42 +1946,81 @@ class InfinitePIPModernUI:
         else:
             cols = 1
 
-        if cols != self._region_fields_columns_current:
-            # Clear existing grid placements
-            for f in self._region_field_frames:
-                f.grid_forget()
-            for c in range(0, 6):
-                container.grid_columnconfigure(c, weight=0)
-            for c in range(cols):
-                container.grid_columnconfigure(c, weight=1, uniform="region_fields")
-
-            for i, f in enumerate(self._region_field_frames):
-                r = i // cols
-                c = i % cols
-                f.grid(row=r, column=c, sticky="ew", padx=(0 if c == 0 else 14, 0), pady=(0, 12))
+        if (
+            cols == self._region_fields_columns_current
+            and len(self._region_field_frames) == self._region_fields_placed_count
+        ):
+            return
 
-            self._region_fields_columns_current = cols
+        # Clear existing grid placements
+        for f in self._region_field_frames:
+            f.grid_forget()
+        for c in range(0, 6):
+            container.grid_columnconfigure(c, weight=0)
+        for c in range(cols):
+            container.grid_columnconfigure(c, weight=1, uniform="region_fields")
+
+        for f, (r, c, padx) in zip(self._region_field_frames, _REGION_FIELD_LAYOUTS[cols]):
+            f.grid(row=r, column=c, sticky="ew", padx=padx, pady=(0, 12))
+
+        self._region_fields_columns_current = cols
+        self._region_fields_placed_count = len(self._region_field_frames)
+
+    def _get_sct(self):
+        """Return this thread's persistent mss instance, opening it on first use."""
+        local = self._sct_local
+        sct = getattr(local, "sct", None)
+        if sct is None or local.generation != self._sct_generation:
+            if sct is not None:
+                try:
+                    sct.close()
+                except Exception:
+                    pass
+            sct = mss.mss()
+            local.sct = sct
+            local.generation = self._sct_generation
+        return sct
 
     def capture_monitor_preview(self, monitor_index):
         """Capture a preview screenshot of a monitor"""
         try:
-            with mss.mss() as sct:
-                monitors = sct.monitors
-                if monitor_index < len(monitors) - 1:
-                    monitor = monitors[monitor_index + 1]
-                    screenshot = sct.grab(monitor)
-                    return Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+            sct = self._get_sct()
+            monitors = sct.monitors
+            if monitor_index < len(monitors) - 1:
+                monitor = monitors[monitor_index + 1]
+                screenshot = sct.grab(monitor)
+                return _screenshot_to_image(screenshot)
         except Exception as e:
-            print(f"Error capturing monitor preview: {e}")
+            if _log_limiter.allow("monitor_preview"):
+                log.warning("Error capturing monitor preview: %s", e)
         return None
 
-    def capture_window_preview(self, window):
-        """Capture a preview screenshot of a window using the same method as PIPs"""
+    def _window_is_capturable(self, hwnd):
+        """False for minimized or hidden windows; cached per hwnd for a short burst."""
+        now = time.monotonic()
+        entry = self._capturable_cache.get(hwnd)
+        if entry is not None and now - entry[0] < 0.5:
+            return entry[1]
+        capturable = bool(win32gui.IsWindowVisible(hwnd)) and not win32gui.IsIconic(hwnd)
+        self._capturable_cache[hwnd] = (now, capturable)
+        return capturable
+
+    def capture_window_preview(self, window, thumb_size=None):
+        """Capture a preview screenshot of a window using the same method as PIPs.
+
+        With `thumb_size`, the Win32 paths let GDI scale straight to that size; the
+        region fallback still returns a full-size image.
+        """
         try:
             # Try direct window capture first (Windows only)
             if WINDOWS_CAPTURE_AVAILABLE and "hwnd" in window:
                 hwnd = window["hwnd"]
                 if hwnd and win32gui.IsWindow(hwnd):
+                    # Minimized/hidden windows have nothing to capture (and the region
+                    # fallback would only grab whatever is at their stale position).
+                    if not self._window_is_capturable(hwnd):
+                        return None
+
                     # Get window dimensions
                     left, top, right, bottom = win32gui.GetWindowRect(hwnd)
                     width = right - left
@@ -1452,180 +2042,167 @@ class InfinitePIPModernUI:
                     if width <= 0 or height <= 0:
                         return None
 
-                    # Try PrintWindow first
-                    img = self.capture_with_print_window(hwnd, width, height)
-                    if img:
-                        return img
-
-                    # Fallback to BitBlt
-                    img = self.capture_with_bitblt(hwnd, width, height)
+                    # PrintWindow, falling back to BitBlt, on one shared GDI surface
+                    img = self._gdi_capture(hwnd, width, height, thumb_size)
                     if img:
                         return img
 
             # Fallback to region capture
             if "bbox" in window:
                 bbox = window["bbox"]
-                with mss.mss() as sct:
-                    capture_bbox = {
-                        "left": bbox[0],
-                        "top": bbox[1],
-                        "width": bbox[2],
-                        "height": bbox[3],
-                    }
-                    screenshot = sct.grab(capture_bbox)
-                    return Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+                sct = self._get_sct()
+                capture_bbox = {
+                    "left": bbox[0],
+                    "top": bbox[1],
+                    "width": bbox[2],
+                    "height": bbox[3],
+                }
+                screenshot = sct.grab(capture_bbox)
+                return _screenshot_to_image(screenshot)
 
         except Exception as e:
-            print(f"Error capturing window preview: {e}")
+            if _log_limiter.allow("window_preview"):
+                log.warning("Error capturing window preview: %s", e)
         return None
 
-    def capture_with_print_window(self, hwnd, width, height):
-        """Capture using PrintWindow API"""
+    def _gdi_capture(self, hwnd, width, height, thumb_size=None):
+        """Capture a window with PrintWindow, falling back to BitBlt (optionally GDI-downscaled).
+
+        Both methods share one window DC + memory DC + DIB, so a failed PrintWindow
+        does not pay for a second round of GDI setup.
+        """
+        hwndDC = None
+        mem_dc = None
+        hbitmap = None
+        old_bitmap = None
         try:
-            # Get window device context
             hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
-
-            # Create bitmap
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-            saveDC.SelectObject(saveBitMap)
+            mem_dc = create_compatible_dc(hwndDC)
 
-            # Copy window content to bitmap using ctypes
-            result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), 3)  # PW_RENDERFULLCONTENT
+            # Top-down 32-bpp DIB section: rows come out in the order Pillow expects
+            # and the pixel memory is read in place (no GetBitmapBits copy).
+            hbitmap, bits = create_top_down_dib(mem_dc, width, height)
+            old_bitmap = select_object(mem_dc, hbitmap)
 
-            if result:
-                # Convert to PIL Image
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-
-                img = Image.frombuffer(
-                    "RGB",
-                    (bmpinfo["bmWidth"], bmpinfo["bmHeight"]),
-                    bmpstr,
-                    "raw",
-                    "BGRX",
-                    0,
-                    1,
-                )
+            # PrintWindow renders into the memory DC; if it fails, read the window DC directly.
+            if windll.user32.PrintWindow(hwnd, mem_dc, 3):  # PW_RENDERFULLCONTENT
+                source_dc = mem_dc
+            else:
+                source_dc = hwndDC
 
-                # Clean up
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+            if thumb_size:
+                return self._stretch_to_image(source_dc, width, height, *thumb_size)
 
-                return img
-            else:
-                # Clean up on failure
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+            if source_dc is hwndDC and not bit_blt(mem_dc, width, height, hwndDC):
                 return None
 
+            # Convert to PIL Image (the BGRX decode copies out of the DIB).
+            # Pillow stores "RGB" as 4 bytes/pixel, so this is a same-stride swizzle;
+            # decoding as RGBA/BGRA would keep GDI's undefined alpha (often 0).
+            return Image.frombuffer(
+                "RGB", (width, height), dib_buffer(bits, width, height), "raw", "BGRX", 0, 1
+            )
+
         except Exception as e:
-            print(f"PrintWindow capture error: {e}")
+            if _log_limiter.allow("gdi"):
+                log.warning("GDI capture error: %s", e)
             return None
 
-    def capture_with_bitblt(self, hwnd, width, height):
-        """Capture using BitBlt API (fallback method)"""
-        try:
-            # Get window device context
-            hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
-
-            # Create bitmap
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-            saveDC.SelectObject(saveBitMap)
-
-            # Copy window content using BitBlt
-            result = saveDC.BitBlt((0, 0), (width, height), mfcDC, (0, 0), win32con.SRCCOPY)
-
-            if result:
-                # Convert to PIL Image
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-
-                img = Image.frombuffer(
-                    "RGB",
-                    (bmpinfo["bmWidth"], bmpinfo["bmHeight"]),
-                    bmpstr,
-                    "raw",
-                    "BGRX",
-                    0,
-                    1,
-                )
-
-                # Clean up
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
+        finally:
+            # Clean up
+            if old_bitmap is not None:
+                select_object(mem_dc, old_bitmap)
+            delete_object(hbitmap)
+            delete_dc(mem_dc)
+            if hwndDC:
                 win32gui.ReleaseDC(hwnd, hwndDC)
 
-                return img
-            else:
-                # Clean up on failure
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+    def _stretch_to_image(self, src_hdc, src_w, src_h, dst_w, dst_h):
+        """HALFTONE-scale a source DC into a dst-sized DIB and return it as a PIL Image."""
+        thumb_dc = create_compatible_dc(src_hdc)
+        hbitmap = None
+        old_bitmap = None
+        try:
+            hbitmap, bits = create_top_down_dib(thumb_dc, dst_w, dst_h)
+            old_bitmap = select_object(thumb_dc, hbitmap)
+            if not stretch_blt_halftone(thumb_dc, dst_w, dst_h, src_hdc, src_w, src_h):
                 return None
-
-        except Exception as e:
-            print(f"BitBlt capture error: {e}")
-            return None
+            return Image.frombuffer(
+                "RGB", (dst_w, dst_h), dib_buffer(bits, dst_w, dst_h), "raw", "BGRX", 0, 1
+            )
+        finally:
+            if old_bitmap is not None:
+                select_object(thumb_dc, old_bitmap)
+            delete_object(hbitmap)
+            delete_dc(thumb_dc)
 
     def update_region_preview(self):
         """Update the region preview image"""
-        try:
-            # Clear previous preview
-            for widget in self.region_preview_container.winfo_children():
-                widget.destroy()
+        # Validate the entries first: bad input keeps the current preview and only
+        # shows (or updates) a single error line under it.
+        values = (
+            self.region_x_entry.get().strip(),
+            self.region_y_entry.get().strip(),
+            self.region_width_entry.get().strip(),
+            self.region_height_entry.get().strip(),
+        )
+        if not all(_INT_RE.match(v) for v in values):
+            label = self._region_input_error_label
+            if label is None:
+                inner = self._region_preview_inner
+                if inner is None:
+                    inner = tk.Frame(self.region_preview_container, **_CARD_BG_KW)
+                    self._swap_list_body("_region_preview_inner", inner)
+                label = ttk.Label(inner, font=_FONT_SMALL, **_CARD_SUBTITLE_LABEL_KW)
+                label.pack(pady=(5, 0))
+                self._region_input_error_label = label
+            label.configure(text="Enter whole numbers for X, Y, width and height.")
+            return
 
+        # Build the new preview into a fresh frame; the old one goes in a single destroy.
+        inner = tk.Frame(self.region_preview_container, **_CARD_BG_KW)
+        try:
             # Get current region values
-            x = int(self.region_x_entry.get())
-            y = int(self.region_y_entry.get())
-            width = int(self.region_width_entry.get())
-            height = int(self.region_height_entry.get())
+            x, y, width, height = map(int, values)
 
             # Capture region preview
-            with mss.mss() as sct:
-                bbox = {"left": x, "top": y, "width": width, "height": height}
-                screenshot = sct.grab(bbox)
-                preview_image = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-
-                # Resize to thumbnail
-                preview_image = preview_image.resize((200, 113), Image.Resampling.LANCZOS)
-                preview_photo = ImageTk.PhotoImage(preview_image)
-
-                preview_label = ttk.Label(
-                    self.region_preview_container, image=preview_photo, style="CardTitle.TLabel"
-                )
-                preview_label.image = preview_photo  # Keep a reference
-                preview_label.pack()
-
-                # Add region info
-                info_label = ttk.Label(
-                    self.region_preview_container,
-                    text=f"Region: {width}×{height} at ({x}, {y})",
-                    font=("Segoe UI", 8),
-                    style="CardSubtitle.TLabel",
-                )
-                info_label.pack(pady=(5, 0))
+            sct = self._get_sct()
+            bbox = {"left": x, "top": y, "width": width, "height": height}
+            screenshot = sct.grab(bbox)
+            preview_image = _screenshot_to_image(screenshot)
+
+            # Resize to thumbnail
+            preview_image = _make_thumbnail(preview_image, (200, 113))
+            preview_photo = ImageTk.PhotoImage(preview_image)
+
+            preview_label = ttk.Label(inner, image=preview_photo, **_CARD_TITLE_LABEL_KW)
+            self._keep_photo(preview_label, preview_photo)
+            preview_label.pack()
+
+            # Add region info
+            info_label = ttk.Label(
+                inner,
+                text=f"Region: {width}×{height} at ({x}, {y})",
+                font=_FONT_SMALL,
+                **_CARD_SUBTITLE_LABEL_KW,
+            )
+            info_label.pack(pady=(5, 0))
 
         except Exception as e:
+            for widget in inner.winfo_children():
+                widget.destroy()
             error_label = ttk.Label(
-                self.region_preview_container,
+                inner,
                 text=f"Preview error: {str(e)[:50]}...",
-                font=("Segoe UI", 8),
-                style="CardSubtitle.TLabel",
+                font=_FONT_SMALL,
+                **_CARD_SUBTITLE_LABEL_KW,
             )
             error_label.pack()
 
+        self._swap_list_body("_region_preview_inner", inner)
+        self._region_input_error_label = None
+        self._prune_photo_refs()
+
     def create_monitor_pip(self, monitor_index):
         """Create a monitor PIP"""
         try:
@@ -1636,36 +2213,48 @@ class InfinitePIPModernUI:
             source_data = {"index": monitor_index, "monitor": self.monitors[monitor_index]}
 
             pip_window = InfinitePIPWindow("monitor", source_data, self)
-            self.active_pips.append(pip_window)
-            self.update_status()
-            self.update_active_pips_list()
+            self.active_pips[pip_window] = None
+            self._request_ui_sync()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create monitor PIP: {str(e)}")
 
-    def create_window_pip(self, window_index):
-        """Create a window PIP"""
+    @staticmethod
+    def _window_key(window):
+        """Stable lookup key for a listed window: its hwnd, or its title when there is none."""
+        hwnd = window.get("hwnd")
+        return hwnd if hwnd is not None else window.get("title")
+
+    def create_window_pip(self, key):
+        """Create a window PIP (`key` as returned by `_window_key`)"""
         try:
-            if window_index >= len(self.windows):
-                messagebox.showerror("Error", "Invalid window index")
+            window_data = self._windows_by_hwnd.get(key) or self._windows_by_title.get(key)
+            if window_data is None:
+                messagebox.showerror("Error", "That window is no longer in the list")
                 return
 
-            window_data = self.windows[window_index]
             pip_window = InfinitePIPWindow("window", window_data, self)
-            self.active_pips.append(pip_window)
-            self.update_status()
-            self.update_active_pips_list()
+            self.active_pips[pip_window] = None
+            self._request_ui_sync()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create window PIP: {str(e)}")
 
     def create_region_pip(self):
         """Create a region PIP"""
+        # Same check as the live preview: reject typos up front instead of via ValueError.
+        values = (
+            self.region_x_entry.get().strip(),
+            self.region_y_entry.get().strip(),
+            self.region_width_entry.get().strip(),
+            self.region_height_entry.get().strip(),
+        )
+        if not all(_INT_RE.match(v) for v in values):
+            messagebox.showerror("Error", "Please enter valid numbers for all fields")
+            return
+
         try:
-            x = int(self.region_x_entry.get())
-            y = int(self.region_y_entry.get())
-            width = int(self.region_width_entry.get())
-            height = int(self.region_height_entry.get())
+            x, y, width, height = map(int, values)
 
             if width <= 0 or height <= 0:
                 messagebox.showerror("Error", "Width and height must be positive")
@@ -1674,12 +2263,9 @@ class InfinitePIPModernUI:
             source_data = {"x": x, "y": y, "width": width, "height": height}
 
             pip_window = InfinitePIPWindow("region", source_data, self)
-            self.active_pips.append(pip_window)
-            self.update_status()
-            self.update_active_pips_list()
+            self.active_pips[pip_window] = None
+            self._request_ui_sync()
 
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid numbers for all fields")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create region PIP: {str(e)}")
 
@@ -1689,31 +2275,20 @@ class InfinitePIPModernUI:
         def on_selection_complete(result):
             if result:
                 # Update the manual input fields with selected values
-                self.region_x_entry.delete(0, tk.END)
-                self.region_x_entry.insert(0, str(result["x"]))
-
-                self.region_y_entry.delete(0, tk.END)
-                self.region_y_entry.insert(0, str(result["y"]))
-
-                self.region_width_entry.delete(0, tk.END)
-                self.region_width_entry.insert(0, str(result["width"]))
-
-                self.region_height_entry.delete(0, tk.END)
-                self.region_height_entry.insert(0, str(result["height"]))
-
-                messagebox.showinfo(
-                    "Area Selected",
-                    f"Selected area: {result['width']}×{result['height']} "
-                    f"at position ({result['x']}, {result['y']})\n\n"
-                    "Values have been filled in the form above. "
-                    "Click 'Create Region PIP' to create the PIP.",
-                )
-
-                auto_create = messagebox.askyesno(
-                    "Auto Create", "Would you like to create the PIP automatically?"
-                )
-                if auto_create:
-                    self.create_region_pip()
+                for key, entry in (
+                    ("x", self.region_x_entry),
+                    ("y", self.region_y_entry),
+                    ("width", self.region_width_entry),
+                    ("height", self.region_height_entry),
+                ):
+                    _set_entry(entry, result[key])
+
+                # No modal confirmations: drawing the area already states the intent.
+                # Either create the PIP now or show the selection in the inline preview.
+                if self.auto_create_region_pip:
+                    self.root.after(0, self.create_region_pip)
+                else:
+                    self.update_region_preview()
             else:
                 messagebox.showinfo(
                     "Selection Cancelled", "Visual region selection was cancelled."
@@ -1729,10 +2304,9 @@ class InfinitePIPModernUI:
         """Close a specific PIP"""
         try:
             pip.close()
-            if pip in self.active_pips:
-                self.active_pips.remove(pip)
-            self.update_status()
-            self.update_active_pips_list()
+            # close() normally reports back through remove_pip (an O(1) dict delete that
+            # refreshes the UI); repeating it here is a no-op unless that callback failed.
+            self.remove_pip(pip)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to close PIP: {str(e)}")
 
@@ -1742,57 +2316,169 @@ class InfinitePIPModernUI:
             messagebox.showinfo("No PIPs", "No active PIPs to close.")
             return
 
-        for pip in self.active_pips[:]:
-            try:
-                pip.close()
-            except Exception:
-                pass
+        self._close_every_pip()
+        self._request_ui_sync()
+        messagebox.showinfo("PIPs Closed", "All PIPs have been closed.")
 
+    def _close_every_pip(self):
+        """Close all PIP windows and empty the active set in one go."""
+        # pip.close() calls back into remove_pip; suppress that so the set is not
+        # mutated (and the UI not refreshed) once per PIP while iterating it.
+        self._bulk_closing = True
+        try:
+            for pip in self.active_pips:
+                try:
+                    pip.close()
+                except Exception:
+                    pass
+        finally:
+            self._bulk_closing = False
         self.active_pips.clear()
-        self.update_status()
-        self.update_active_pips_list()
-        messagebox.showinfo("PIPs Closed", "All PIPs have been closed.")
 
     def refresh_windows(self):
-        """Refresh the windows list"""
+        """Debounce window list refreshes (button mashing, refresh-all bursts)."""
         try:
-            import pygetwindow as gw
+            if self._refresh_windows_after_id is not None:
+                self.root.after_cancel(self._refresh_windows_after_id)
+            self._refresh_windows_after_id = self.root.after(75, self._do_refresh_windows)
+        except Exception:
+            self._do_refresh_windows()
+
+    def _do_refresh_windows(self):
+        """Refresh the windows list (enumeration runs off the UI thread)"""
+        self._refresh_windows_after_id = None
+        # Rapid repeated refreshes reuse the last enumeration.
+        cache = self._windows_enum_cache
+        if cache is not None and (time.monotonic() - cache[0]) < 0.5:
+            self._apply_windows_list(cache[1])
+            return
 
-            self.windows = []
-            for window in gw.getAllWindows():
-                if window.title and window.title.strip() and window.visible:
-                    try:
-                        bbox = (window.left, window.top, window.width, window.height)
-                        window_data = {"title": window.title, "bbox": bbox}
-
-                        # Add Windows-specific data if available
-                        if WINDOWS_CAPTURE_AVAILABLE:
-                            try:
-                                hwnd = window._hWnd
-                                if win32gui.IsWindow(hwnd):
-                                    window_data["hwnd"] = hwnd
-                            except Exception:
-                                pass
-
-                        self.windows.append(window_data)
-                    except Exception:
-                        continue
+        # An enumeration is already running; its result will update the UI.
+        if self._windows_enum_future is not None and not self._windows_enum_future.done():
+            return
 
-            # Sort by title
-            self.windows.sort(key=lambda x: x["title"].lower())
+        try:
+            self._windows_enum_future = self._enum_pool.submit(self._enumerate_windows_worker)
+            self._windows_enum_future.add_done_callback(self._on_windows_enumerated)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to refresh windows: {str(e)}")
 
-            # Update UI if windows tab is active
-            if hasattr(self, "windows_container"):
-                self.update_windows_list()
+    def _enumerate_windows_worker(self):
+        """Enumerate top-level windows (worker thread; must not touch Tk)."""
+        if WINDOWS_CAPTURE_AVAILABLE:
+            windows = self._enumerate_windows_win32()
+        else:
+            windows = self._enumerate_windows_pygetwindow()
+
+        # Sort by title (case-insensitive key computed once per window)
+        windows.sort(key=_WINDOW_SORT_KEY)
+        return windows
+
+    @staticmethod
+    def _enumerate_windows_win32():
+        """One EnumWindows pass reading title, visibility and rect per handle."""
+        windows = []
+        # Bound once: the callback runs for every top-level handle on the system.
+        is_visible = win32gui.IsWindowVisible
+        get_text = win32gui.GetWindowText
+        get_rect = win32gui.GetWindowRect
+
+        def callback(hwnd, out):
+            # IsWindowVisible/GetWindowText just return 0/"" for a dead handle; only
+            # GetWindowRect raises, and that must not abort the whole enumeration.
+            if not is_visible(hwnd):
+                return True
+            title = get_text(hwnd)
+            if not title or title.isspace():
+                return True
+            try:
+                left, top, right, bottom = get_rect(hwnd)
+            except Exception:
+                return True
+            out.append(
+                {
+                    "title": title,
+                    "bbox": (left, top, right - left, bottom - top),
+                    "hwnd": hwnd,
+                    "_sort_key": title.lower(),
+                }
+            )
+            return True
+
+        win32gui.EnumWindows(callback, windows)
+        return windows
+
+    @staticmethod
+    def _enumerate_windows_pygetwindow():
+        """Fallback enumeration through pygetwindow (no window handles)."""
+        if gw is None:
+            raise RuntimeError("window listing needs pywin32 or pygetwindow")
+
+        windows = []
+        for window in gw.getAllWindows():
+            # Each pygetwindow property is a fresh OS query: read the title once and
+            # take the rect as one `box` instead of four left/top/width/height reads.
+            title = window.title
+            if not title or title.isspace() or not window.visible:
+                continue
+            try:
+                bbox = tuple(window.box)
+            except Exception:
+                continue  # closed while enumerating
+            windows.append({"title": title, "bbox": bbox, "_sort_key": title.lower()})
+        return windows
 
+    def _on_windows_enumerated(self, future):
+        """Worker callback: hand the enumeration result back to the Tk thread."""
+        if self.is_closing:
+            return
+        try:
+            windows = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to refresh windows: {str(e)}")
+            message = f"Failed to refresh windows: {str(e)}"
+            try:
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+            except Exception:
+                pass
+            return
+
+        self._windows_enum_cache = (time.monotonic(), windows)
+        try:
+            self.root.after(0, self._apply_windows_list, windows)
+        except Exception:
+            pass
+
+    def _apply_windows_list(self, windows):
+        """Install a freshly enumerated windows list and update the UI (Tk thread)."""
+        self.windows = list(windows)
+        self._windows_by_hwnd = {w["hwnd"]: w for w in self.windows if "hwnd" in w}
+        # Forget capturability of windows that are gone. Capture workers write to the
+        # cache, so build a pruned copy (list() snapshots the items) and swap it in.
+        self._capturable_cache = {
+            hwnd: entry
+            for hwnd, entry in list(self._capturable_cache.items())
+            if hwnd in self._windows_by_hwnd
+        }
+        self._windows_by_title = {}
+        for w in self.windows:
+            self._windows_by_title.setdefault(w["title"], w)
 
-    def refresh_all_sources(self):
+        # Update UI if windows tab is active
+        if self.windows_container is not None:
+            self.update_windows_list()
+
+    def refresh_all_sources(self, force=False):
         """Refresh all source lists"""
         try:
-            # Refresh monitors
-            self.monitors = list(screeninfo.get_monitors())
+            # Refresh monitors (topology rarely changes: re-query at most every 2s unless forced)
+            now = time.monotonic()
+            if force or now - self._monitors_cache_ts > 2.0:
+                self.monitors = list(screeninfo.get_monitors())
+                self._monitors_cache_ts = now
+                self._monitor_display = self._format_monitor_display(self.monitors)
+                self._sct_generation += 1
+            self._monitor_preview_cache.clear()
+            self._rebuild_monitor_cards()
 
             # Refresh windows
             self.refresh_windows()
@@ -1804,37 +2490,40 @@ class InfinitePIPModernUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh sources: {str(e)}")
 
+    def _request_ui_sync(self):
+        """Refresh the status header and Active PIPs list once for a burst of PIP changes."""
+        if self._ui_sync_after_id is not None:
+            return
+        try:
+            self._ui_sync_after_id = self.root.after(20, self._do_ui_sync)
+        except Exception:
+            self._do_ui_sync()
+
+    def _do_ui_sync(self):
+        self._ui_sync_after_id = None
+        self.update_status()
+        self.update_active_pips_list()
+
     def update_status(self):
         """Update the status display"""
         pip_count = len(self.active_pips)
-        if pip_count == 0:
-            try:
-                self._status_dot.itemconfig(self._status_dot_id, fill=self.colors["accent_secondary"])
-            except Exception:
-                pass
-            try:
-                self.status_label.configure(text="Ready")
-            except Exception:
-                pass
-            try:
-                self._pips_counter_number.configure(text="0")
-                self.pips_counter.configure(text=" Active PIPs")
-            except Exception:
-                pass
-        else:
-            try:
-                self._status_dot.itemconfig(self._status_dot_id, fill=self.colors["accent_primary"])
-            except Exception:
-                pass
-            try:
-                self.status_label.configure(text="Active")
-            except Exception:
-                pass
-            try:
-                self._pips_counter_number.configure(text=str(pip_count))
-                self.pips_counter.configure(text=" Active PIPs")
-            except Exception:
-                pass
+        last_count = self._last_status_pip_count
+        # Each configure is a Tcl round-trip; skip the whole update when nothing changed.
+        if pip_count == last_count:
+            return
+        self._last_status_pip_count = pip_count
+        try:
+            # Dot colour and label only flip between "no PIPs" and "some PIPs".
+            if (pip_count == 0) != (last_count == 0):
+                if pip_count == 0:
+                    fill, status_text = self.colors.accent_secondary, "Ready"
+                else:
+                    fill, status_text = self.colors.accent_primary, "Active"
+                self._status_dot.itemconfig(self._status_dot_id, fill=fill)
+                self.status_label.configure(text=status_text)
+            self._pips_counter_number.configure(text=str(pip_count))
+        except Exception:
+            pass
         self._update_close_all_visibility()
 
     def _update_close_all_visibility(self):
@@ -1842,24 +2531,45 @@ class InfinitePIPModernUI:
         try:
             if self._close_all_button is None:
                 return
-            if len(self.active_pips) > 0:
-                if not self._close_all_button.winfo_ismapped():
-                    self._close_all_button.pack(side=tk.RIGHT)
+            # Compare against the last applied state instead of asking Tk (winfo_ismapped).
+            want = len(self.active_pips) > 0
+            if want == self._close_all_visible:
+                return
+            if want:
+                self._close_all_button.pack(side=tk.RIGHT)
             else:
-                if self._close_all_button.winfo_ismapped():
-                    self._close_all_button.pack_forget()
+                self._close_all_button.pack_forget()
+            self._close_all_visible = want
         except Exception:
             # Never allow UI updates to crash the app
             pass
 
     def _schedule_layout_regions_cards(self, _event=None):
         """Debounce regions relayout (called on resize)."""
-        try:
-            if self._regions_layout_after_id:
-                self.root.after_cancel(self._regions_layout_after_id)
-        except Exception:
-            pass
-        self._regions_layout_after_id = self.root.after(50, self._layout_regions_cards)
+        # No-op resize: this width maps to the column count already applied.
+        if (
+            _event is not None
+            and _event.widget is self._regions_cards_container
+            and self._regions_columns_for(_event.width) == self._regions_columns_current
+        ):
+            return
+        # Coalesce a burst of events into one layout once the event queue drains.
+        if self._regions_layout_pending:
+            return
+        self._regions_layout_pending = True
+        self.root.after_idle(self._run_regions_cards_layout)
+
+    def _run_regions_cards_layout(self):
+        """Idle callback for `_schedule_layout_regions_cards`."""
+        self._regions_layout_pending = False
+        self._layout_regions_cards()
+
+    def _regions_columns_for(self, width):
+        """Column count for the Regions tab at `width` (with hysteresis when leaving 2)."""
+        threshold = _REGIONS_TWO_COLUMN_WIDTH
+        if self._regions_columns_current == 2:
+            threshold -= _REGIONS_COLUMN_HYSTERESIS
+        return 2 if width >= threshold else 1
 
     def _layout_regions_cards(self):
         """Responsive Regions layout: 2 columns when wide, 1 column when narrow."""
@@ -1873,14 +2583,14 @@ class InfinitePIPModernUI:
         container = self._regions_cards_container
         width = container.winfo_width()
         if width <= 1:
-            # Not yet laid out; try again shortly.
+            # Not yet laid out; try again shortly (a timed retry, so it cannot spin on idle).
             try:
-                self._schedule_layout_regions_cards()
+                self.root.after(50, self._schedule_layout_regions_cards)
             except Exception:
                 pass
             return
 
-        cols = 2 if width >= 900 else 1
+        cols = self._regions_columns_for(width)
         if cols == self._regions_columns_current:
             return
 
@@ -1907,10 +2617,11 @@ class InfinitePIPModernUI:
 
     def remove_pip(self, pip_window):
         """Remove a PIP from the active list (called by PIP window on close)"""
+        if self._bulk_closing:
+            return
         if pip_window in self.active_pips:
-            self.active_pips.remove(pip_window)
-            self.update_status()
-            self.update_active_pips_list()
+            del self.active_pips[pip_window]
+            self._request_ui_sync()
 
     def run(self):
         """Start the application"""
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+import logging
+import queue
 import threading
 import time
 import tkinter as tk
@@ -7,23 +10,116 @@ import tkinter as tk
 from ..deps import (
     Image,
     ImageTk,
+    WGC_AVAILABLE,
+    WGC_TAKES_HWND,
     WINDOWS_CAPTURE_AVAILABLE,
+    WindowsCapture,
+    gw,
     mss,
-    pyautogui,
     screeninfo,
-    win32con,
     win32gui,
-    win32ui,
     windll,
 )
+from ..platform.gdi import (
+    bit_blt,
+    create_compatible_dc,
+    create_top_down_dib,
+    delete_dc,
+    delete_object,
+    dib_buffer,
+    select_object,
+    stretch_blt_halftone,
+)
+from ..ratelimit import RateLimiter
+
+log = logging.getLogger(__name__)
+
+# Resize hit zones (px from the window border) and corner lookup by
+# (left, right, top, bottom) bit code.
+_CORNER_SIZE = 20
+_EDGE_SIZE = 10
+_RESIZE_CORNERS = {0b1010: "nw", 0b0110: "ne", 0b1001: "sw", 0b0101: "se"}
+
+# Filter for the per-frame PIP resample. LANCZOS is the sharpest and slowest;
+# BILINEAR is several times cheaper on weak CPUs. Fast Scaling and live resizing
+# use NEAREST regardless.
+RESAMPLE_FILTER = Image.Resampling.LANCZOS
+
+# Source aspect-ratio changes smaller than this are treated as jitter.
+_ASPECT_EPSILON = 0.01
+
+# Context-menu opacity choices, top to bottom.
+_OPACITY_LEVELS = [
+    (1.0, "100% (Opaque)"),
+    (0.9, "90%"),
+    (0.8, "80%"),
+    (0.7, "70%"),
+    (0.6, "60%"),
+    (0.5, "50%"),
+    (0.4, "40%"),
+    (0.3, "30%"),
+    (0.2, "20%"),
+    (0.1, "10%"),
+]
+
+# Window sources re-read size/position/minimized state every this many frames.
+_WIN_META_FRAMES = 10
+
+
+# Both crop helpers only change with the source or canvas size, so they are memoized
+# (shared by all PIPs and by the GDI and Pillow scaling paths).
+@functools.lru_cache(maxsize=32)
+def _fill_crop(src_w, src_h, dst_w, dst_h):
+    """Centered `(x, y, w, h)` of the source with the target's aspect ratio (crop-to-fill)."""
+    if src_w * dst_h > dst_w * src_h:
+        # Source is wider than the target: trim the sides
+        w = max(1, round(src_h * dst_w / dst_h))
+        return (src_w - w) // 2, 0, w, src_h
+    # Source is taller than the target: trim top and bottom
+    h = max(1, round(src_w * dst_h / dst_w))
+    return 0, (src_h - h) // 2, src_w, h
+
+
+@functools.lru_cache(maxsize=32)
+def _resize_box(src_w, src_h, dst_w, dst_h):
+    """Pillow `box=` for a crop-to-fill resize, or None when no crop is needed."""
+    x, y, w, h = _fill_crop(src_w, src_h, dst_w, dst_h)
+    if (w, h) == (src_w, src_h):
+        return None
+    return x, y, x + w, y + h
+
+
+def _top_level_windows_titled(title):
+    """Handles of all top-level windows whose title is exactly `title`."""
+    hwnds = []
+
+    def _collect(hwnd, _):
+        if win32gui.GetWindowText(hwnd) == title:
+            hwnds.append(hwnd)
+        return True
+
+    win32gui.EnumWindows(_collect, None)
+    return hwnds
+
+
+# The capture loop runs ~30x/s; a persistent failure should not flood the console.
+_log_limiter = RateLimiter(2.0)
 
 
 class InfinitePIPWindow:
+    # Shared across PIPs: the placeholder font and rendered placeholders, keyed by text.
+    # Placeholders are never modified downstream (resizing makes a new image).
+    _placeholder_font = None
+    _placeholder_cache = {}
+
     def __init__(self, source_type, source_data, manager):
         self.source_type = source_type
         self.source_data = source_data
         self.manager = manager
         self.running = True
+        # _stop ends the capture loop; _wake cuts its frame wait short (fresh frame now).
+        self._stop = threading.Event()
+        self._wake = threading.Event()
         self.window = None
         self.canvas = None
         self.capture_thread = None
@@ -31,13 +127,58 @@ class InfinitePIPWindow:
         self.resize_start_x = 0
         self.resize_start_y = 0
         self.resize_corner = None
+        # Live resize is applied at most ~60 times a second; motion events in between
+        # only replace the pending one (deltas accumulate from resize_start_*).
+        self._pending_resize_event = None
+        self._resize_after_id = None
+        self._last_resize_ts = 0.0
         self.last_x = 0
         self.last_y = 0
-        self.source_aspect_ratio = None
+        self.source_aspect_ratio = None  # set via _set_aspect_ratio
+        self._inv_aspect_ratio = 0.0
+        self._pip_resize_pending = False  # update_pip_window_size queued on Tk
         self.maintain_aspect_ratio = True
         self.auto_resize_on_source_change = True
+        self.fast_resample = False  # nearest-neighbour scaling instead of RESAMPLE_FILTER
         self.last_source_size = None
         self.opacity = 1.0  # Default to fully opaque
+        self.opacity_indicator = None  # hidden canvas text item, shown by show_opacity_indicator
+        self._opacity_hide_id = None
+        # mss instance and monitor list for monitor sources; created and closed on the
+        # capture thread (mss handles are not safe to share across threads).
+        self._sct = None
+        self._monitors = None
+        self._gdi = {}  # slot -> (size, mem_dc, hbitmap, bits, old_bitmap) for window sources
+        # Set around each capture: the canvas size (GDI scales window sources to it) and
+        # the true source size when the returned image has already been scaled.
+        self._target_size = None
+        self._source_size = None
+        # Window geometry/state is re-queried every _WIN_META_FRAMES frames, not every frame.
+        self._win_meta = None  # (hwnd, width, height, iconic)
+        self._win_meta_tick = 0
+        self._tracked_window = None  # pygetwindow match reused by update_window_position
+        # Latest captured frame waiting for the Tk thread; newer frames replace it.
+        self._frame_lock = threading.Lock()
+        self._pending_frame = None
+        self._flush_scheduled = False
+        # Capture -> resize hand-off: (img, canvas_size), newest only; None stops the resizer.
+        self._raw_q = queue.Queue(maxsize=1)
+        self.resize_thread = None
+        self._wgc_control = None  # windows-capture session for WGC window sources
+        self._wgc_last_t = 0.0
+        # One Tk photo + canvas item reused across frames (recreated only on resize).
+        self._tk_photo = None
+        self._canvas_image_id = None
+        self._last_size = (0, 0)  # Updated from <Configure>; avoids winfo_* round-trips
+        # Canvas size from the canvas <Configure>; read by the capture threads too.
+        self._canvas_size = (0, 0)
+        self._cursor = ""  # Last cursor set by on_motion
+        # Right-click menu, built on first use (see show_context_menu)
+        self._context_menu = None
+        self._context_menu_key = None
+        self._menu_toggles = []
+        self._opacity_menu = None
+        self._opacity_checked = None
 
         self.setup_window()
         self.calculate_aspect_ratio()
@@ -52,6 +193,7 @@ class InfinitePIPWindow:
         initial_height = 300
 
         self.window.geometry(f"{initial_width}x{initial_height}")
+        self._last_size = (initial_width, initial_height)
         self.window.attributes("-topmost", True)
 
         # Remove window decorations for borderless appearance
@@ -60,12 +202,23 @@ class InfinitePIPWindow:
 
         self.canvas = tk.Canvas(self.window, bg="black", highlightthickness=0, bd=0)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        self.opacity_indicator = self.canvas.create_text(
+            0,
+            0,
+            text="",
+            fill="white",
+            font=("Arial", 12, "bold"),
+            tags="opacity_indicator",
+            state="hidden",
+        )
 
         self.canvas.bind("<Button-1>", self.on_click)
         self.canvas.bind("<B1-Motion>", self.on_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_release)
         self.canvas.bind("<Button-3>", self.show_context_menu)
         self.canvas.bind("<Motion>", self.on_motion)
+        self.window.bind("<Configure>", self._on_window_configure, add="+")
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         # Add keyboard shortcuts for opacity control
         self.window.bind("<KeyPress-plus>", lambda e: self.adjust_opacity(0.1))
@@ -80,6 +233,27 @@ class InfinitePIPWindow:
 
         self.create_resize_handles()
 
+    def _on_window_configure(self, event):
+        """Track the PIP window size so callers don't need winfo_* queries."""
+        # Toplevel bindings also receive <Configure> from child widgets.
+        if event.widget is self.window:
+            self._last_size = (event.width, event.height)
+
+    def _on_canvas_configure(self, event):
+        """Track the canvas size and lay out the size-dependent canvas items."""
+        width, height = event.width, event.height
+        self._canvas_size = (width, height)
+        if self._canvas_image_id is not None:
+            self.canvas.coords(self._canvas_image_id, width // 2, height // 2)
+        # Add subtle resize indicators on borderless window
+        self.canvas.delete("resize_indicator")
+        self.draw_resize_indicators(width, height)
+
+    @property
+    def last_size(self):
+        """Last known (width, height) of the PIP window."""
+        return self._last_size
+
     def calculate_aspect_ratio(self):
         """Calculate and store the aspect ratio of the source"""
         try:
@@ -87,19 +261,17 @@ class InfinitePIPWindow:
                 monitors = list(screeninfo.get_monitors())
                 if self.source_data["index"] < len(monitors):
                     monitor = monitors[self.source_data["index"]]
-                    self.source_aspect_ratio = monitor.width / monitor.height
+                    self._set_aspect_ratio(monitor.width / monitor.height)
             elif self.source_type == "window":
                 bbox = self.source_data["bbox"]
-                self.source_aspect_ratio = bbox[2] / bbox[3]  # width / height
+                self._set_aspect_ratio(bbox[2] / bbox[3])  # width / height
             elif self.source_type == "region":
-                self.source_aspect_ratio = (
-                    self.source_data["width"] / self.source_data["height"]
-                )
+                self._set_aspect_ratio(self.source_data["width"] / self.source_data["height"])
 
             # Update initial window size to match aspect ratio
             if self.source_aspect_ratio:
                 initial_width = 400
-                initial_height = int(initial_width / self.source_aspect_ratio)
+                initial_height = int(initial_width * self._inv_aspect_ratio)
                 # Ensure minimum size
                 if initial_height < 150:
                     initial_height = 150
@@ -107,8 +279,13 @@ class InfinitePIPWindow:
                 self.window.geometry(f"{initial_width}x{initial_height}")
 
         except Exception as e:
-            print(f"Error calculating aspect ratio: {e}")
-            self.source_aspect_ratio = None
+            log.warning("Error calculating aspect ratio: %s", e)
+            self._set_aspect_ratio(None)
+
+    def _set_aspect_ratio(self, ratio):
+        """Set the source aspect ratio (width / height) and its cached inverse."""
+        self.source_aspect_ratio = ratio
+        self._inv_aspect_ratio = 1.0 / ratio if ratio else 0.0
 
     def create_resize_handles(self):
         self.resize_handles = {
@@ -132,37 +309,38 @@ class InfinitePIPWindow:
         return "Unknown Source"
 
     def get_resize_corner(self, x, y):
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-
-        corner_size = 20
-        edge_size = 10
-
-        if x >= width - corner_size and y >= height - corner_size:
-            return "se"
-        elif x <= corner_size and y >= height - corner_size:
-            return "sw"
-        elif x >= width - corner_size and y <= corner_size:
-            return "ne"
-        elif x <= corner_size and y <= corner_size:
-            return "nw"
-        elif y <= edge_size:
+        width, height = self._last_size
+
+        # Corner zones as a (left, right, top, bottom) bit code, resolved by one lookup.
+        code = (
+            (x <= _CORNER_SIZE) << 3
+            | (x >= width - _CORNER_SIZE) << 2
+            | (y <= _CORNER_SIZE) << 1
+            | (y >= height - _CORNER_SIZE)
+        )
+        if not code:
+            return None  # edge bands lie inside the corner bands
+        return _RESIZE_CORNERS.get(code) or self._resize_edge(x, y, width, height)
+
+    @staticmethod
+    def _resize_edge(x, y, width, height):
+        if y <= _EDGE_SIZE:
             return "n"
-        elif y >= height - edge_size:
+        if y >= height - _EDGE_SIZE:
             return "s"
-        elif x >= width - edge_size:
+        if x >= width - _EDGE_SIZE:
             return "e"
-        elif x <= edge_size:
+        if x <= _EDGE_SIZE:
             return "w"
-
         return None
 
     def on_motion(self, event):
         corner = self.get_resize_corner(event.x, event.y)
-        if corner:
-            self.window.config(cursor=self.resize_handles[corner]["cursor"])
-        else:
-            self.window.config(cursor="")
+        cursor = self.resize_handles[corner]["cursor"] if corner else ""
+        # Motion fires constantly; only touch the window when the cursor changes.
+        if cursor != self._cursor:
+            self._cursor = cursor
+            self.window.config(cursor=cursor)
 
     def on_click(self, event):
         self.resize_corner = self.get_resize_corner(event.x, event.y)
@@ -176,7 +354,7 @@ class InfinitePIPWindow:
 
     def on_drag(self, event):
         if self.is_resizing and self.resize_corner:
-            self.handle_resize(event)
+            self._schedule_resize(event)
         else:
             self.handle_move(event)
 
@@ -189,6 +367,22 @@ class InfinitePIPWindow:
         self.last_x = event.x_root
         self.last_y = event.y_root
 
+    def _schedule_resize(self, event):
+        self._pending_resize_event = event
+        if self._resize_after_id is not None:
+            return
+        wait_ms = max(0, int((self._last_resize_ts + 1 / 60 - time.monotonic()) * 1000))
+        self._resize_after_id = self.window.after(wait_ms, self._apply_pending_resize)
+
+    def _apply_pending_resize(self):
+        self._resize_after_id = None
+        event = self._pending_resize_event
+        self._pending_resize_event = None
+        if event is None or not self.resize_corner:
+            return
+        self._last_resize_ts = time.monotonic()
+        self.handle_resize(event)
+
     def handle_resize(self, event):
         current_width = self.window.winfo_width()
         current_height = self.window.winfo_height()
@@ -220,7 +414,14 @@ class InfinitePIPWindow:
         # Apply aspect ratio constraint if available and enabled
         if self.source_aspect_ratio and self.maintain_aspect_ratio:
             new_width, new_height, new_x, new_y = self.constrain_aspect_ratio(
-                new_width, new_height, new_x, new_y, current_x, current_y
+                new_width,
+                new_height,
+                new_x,
+                new_y,
+                current_x,
+                current_y,
+                current_width,
+                current_height,
             )
 
         self.window.geometry(f"{new_width}x{new_height}+{new_x}+{new_y}")
@@ -228,109 +429,133 @@ class InfinitePIPWindow:
         self.resize_start_y = event.y_root
 
     def constrain_aspect_ratio(
-        self, new_width, new_height, new_x, new_y, current_x, current_y
+        self,
+        new_width,
+        new_height,
+        new_x,
+        new_y,
+        current_x,
+        current_y,
+        current_width,
+        current_height,
     ):
         """Constrain resize to maintain aspect ratio"""
-        target_ratio = self.source_aspect_ratio
+        ratio = self.source_aspect_ratio
+        inv_ratio = self._inv_aspect_ratio
+        corner = self.resize_corner
 
         # Determine which dimension to prioritize based on resize direction
-        if self.resize_corner in ["e", "w"]:
+        if corner in ("e", "w"):
             # Horizontal resize - adjust height to match width
-            new_height = int(new_width / target_ratio)
-            new_height = max(150, new_height)  # Ensure minimum height
-            new_width = int(new_height * target_ratio)  # Recalculate width for exact ratio
-        elif self.resize_corner in ["n", "s"]:
+            new_height = max(150, int(new_width * inv_ratio))  # Ensure minimum height
+            new_width = int(new_height * ratio)  # Recalculate width for exact ratio
+        elif corner in ("n", "s"):
             # Vertical resize - adjust width to match height
-            new_width = int(new_height * target_ratio)
-            new_width = max(200, new_width)  # Ensure minimum width
-            new_height = int(new_width / target_ratio)  # Recalculate height for exact ratio
+            new_width = max(200, int(new_height * ratio))  # Ensure minimum width
+            new_height = int(new_width * inv_ratio)  # Recalculate height for exact ratio
+        elif abs(new_width - current_width) > abs(new_height - current_height):
+            # Corner resize, width changed more - adjust height
+            new_height = max(150, int(new_width * inv_ratio))
+            new_width = int(new_height * ratio)
         else:
-            # Corner resize - maintain aspect ratio by choosing the dimension that changed most
-            width_change = abs(new_width - self.window.winfo_width())
-            height_change = abs(new_height - self.window.winfo_height())
-
-            if width_change > height_change:
-                # Width changed more - adjust height
-                new_height = int(new_width / target_ratio)
-                new_height = max(150, new_height)
-                new_width = int(new_height * target_ratio)
-            else:
-                # Height changed more - adjust width
-                new_width = int(new_height * target_ratio)
-                new_width = max(200, new_width)
-                new_height = int(new_width / target_ratio)
+            # Corner resize, height changed more - adjust width
+            new_width = max(200, int(new_height * ratio))
+            new_height = int(new_width * inv_ratio)
 
         # Adjust position for corners that should stay fixed
-        if "n" in self.resize_corner:
+        if "n" in corner:
             # Top edge moves - adjust Y position
-            height_diff = new_height - self.window.winfo_height()
-            new_y = current_y - height_diff
+            new_y = current_y - (new_height - current_height)
 
-        if "w" in self.resize_corner:
+        if "w" in corner:
             # Left edge moves - adjust X position
-            width_diff = new_width - self.window.winfo_width()
-            new_x = current_x - width_diff
+            new_x = current_x - (new_width - current_width)
 
         return new_width, new_height, new_x, new_y
 
     def on_release(self, event):
+        # Apply the last throttled step so the final size matches the pointer.
+        if self._resize_after_id is not None:
+            self.window.after_cancel(self._resize_after_id)
+            self._apply_pending_resize()
+        if self.is_resizing:
+            # Redraw at the final size (full-quality resample) without waiting a frame.
+            self._wake.set()
         self.is_resizing = False
         self.resize_corner = None
 
     def show_context_menu(self, event):
+        # The menu is built once and only its checkmarks are refreshed per right-click;
+        # it is rebuilt if the aspect-ratio entry appears or disappears.
+        menu_key = bool(self.source_aspect_ratio)
+        if self._context_menu is None or self._context_menu_key != menu_key:
+            if self._context_menu is not None:
+                self._context_menu.destroy()
+            self._build_context_menu()
+            self._context_menu_key = menu_key
+
+        for index, label, is_checked in self._menu_toggles:
+            display_label = f"✓ {label}" if is_checked() else label
+            self._context_menu.entryconfigure(index, label=display_label)
+
+        # Move the opacity checkmark only when the current level changed
+        checked = None
+        for index, (opacity_value, _label) in enumerate(_OPACITY_LEVELS):
+            if abs(self.opacity - opacity_value) < 0.01:  # Account for floating point precision
+                checked = index
+                break
+        if checked != self._opacity_checked:
+            if self._opacity_checked is not None:
+                label = _OPACITY_LEVELS[self._opacity_checked][1]
+                self._opacity_menu.entryconfigure(self._opacity_checked, label=label)
+            if checked is not None:
+                label = _OPACITY_LEVELS[checked][1]
+                self._opacity_menu.entryconfigure(checked, label=f"✓ {label}")
+            self._opacity_checked = checked
+
+        self._context_menu.tk_popup(event.x_root, event.y_root)
+
+    def _build_context_menu(self):
         context_menu = tk.Menu(self.window, tearoff=0)
+        # (entry index, label, is_checked) for entries that carry a checkmark
+        toggles = []
+
+        def add_toggle(label, command, is_checked):
+            context_menu.add_command(label=label, command=command)
+            toggles.append((context_menu.index("end"), label, is_checked))
 
         # Always on Top with checkmark
-        topmost_state = self.window.attributes("-topmost")
-        topmost_label = "✓ Always on Top" if topmost_state else "Always on Top"
-        context_menu.add_command(label=topmost_label, command=self.toggle_topmost)
+        add_toggle(
+            "Always on Top", self.toggle_topmost, lambda: self.window.attributes("-topmost")
+        )
 
         # Add aspect ratio toggle if we have aspect ratio info
         if self.source_aspect_ratio:
-            aspect_label = (
-                "✓ Maintain Aspect Ratio"
-                if self.maintain_aspect_ratio
-                else "Maintain Aspect Ratio"
+            add_toggle(
+                "Maintain Aspect Ratio",
+                self.toggle_aspect_ratio,
+                lambda: self.maintain_aspect_ratio,
             )
-            context_menu.add_command(label=aspect_label, command=self.toggle_aspect_ratio)
 
         # Add auto-resize toggle for window sources
         if self.source_type == "window":
-            auto_resize_label = (
-                "✓ Auto-resize on Source Change"
-                if self.auto_resize_on_source_change
-                else "Auto-resize on Source Change"
+            add_toggle(
+                "Auto-resize on Source Change",
+                self.toggle_auto_resize,
+                lambda: self.auto_resize_on_source_change,
             )
-            context_menu.add_command(label=auto_resize_label, command=self.toggle_auto_resize)
+
+        add_toggle("Fast Scaling", self.toggle_fast_resample, lambda: self.fast_resample)
 
         # Add opacity submenu
         context_menu.add_separator()
         opacity_menu = tk.Menu(context_menu, tearoff=0)
         context_menu.add_cascade(label="Opacity", menu=opacity_menu)
 
-        # Add opacity options
-        opacity_levels = [
-            (1.0, "100% (Opaque)"),
-            (0.9, "90%"),
-            (0.8, "80%"),
-            (0.7, "70%"),
-            (0.6, "60%"),
-            (0.5, "50%"),
-            (0.4, "40%"),
-            (0.3, "30%"),
-            (0.2, "20%"),
-            (0.1, "10%"),
-        ]
-
-        for opacity_value, label in opacity_levels:
-            # Add checkmark for current opacity
-            if abs(self.opacity - opacity_value) < 0.01:  # Account for floating point precision
-                display_label = f"✓ {label}"
-            else:
-                display_label = label
-
+        # Add opacity options (checkmark applied by show_context_menu)
+        for opacity_value, label in _OPACITY_LEVELS:
             opacity_menu.add_command(
-                label=display_label, command=lambda o=opacity_value: self.set_opacity(o)
+                label=label, command=lambda o=opacity_value: self.set_opacity(o)
             )
 
         context_menu.add_separator()
@@ -345,7 +570,11 @@ class InfinitePIPWindow:
 
         context_menu.add_separator()
         context_menu.add_command(label="Close PIP", command=self.close)
-        context_menu.tk_popup(event.x_root, event.y_root)
+
+        self._context_menu = context_menu
+        self._menu_toggles = toggles
+        self._opacity_menu = opacity_menu
+        self._opacity_checked = None
 
     def toggle_topmost(self):
         current_state = self.window.attributes("-topmost")
@@ -357,6 +586,9 @@ class InfinitePIPWindow:
     def toggle_auto_resize(self):
         self.auto_resize_on_source_change = not self.auto_resize_on_source_change
 
+    def toggle_fast_resample(self):
+        self.fast_resample = not self.fast_resample
+
     def set_opacity(self, opacity_value):
         """Set the opacity/transparency of the PIP window"""
         # Clamp opacity between 0.1 and 1.0 (don't allow completely transparent)
@@ -376,63 +608,214 @@ class InfinitePIPWindow:
 
     def show_opacity_indicator(self):
         """Show a temporary opacity indicator"""
-        if hasattr(self, "opacity_indicator"):
-            self.canvas.delete(self.opacity_indicator)
-
-        # Create a temporary text indicator
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        # One hidden text item is reused; each keypress restarts a single hide timer.
+        canvas_width, canvas_height = self._canvas_size
 
         opacity_text = f"Opacity: {int(self.opacity * 100)}%"
-        self.opacity_indicator = self.canvas.create_text(
-            canvas_width // 2,
-            canvas_height // 2,
-            text=opacity_text,
-            fill="white",
-            font=("Arial", 12, "bold"),
-            tags="opacity_indicator",
-        )
+        self.canvas.coords(self.opacity_indicator, canvas_width // 2, canvas_height // 2)
+        self.canvas.itemconfigure(self.opacity_indicator, text=opacity_text, state="normal")
+        self.canvas.tag_raise(self.opacity_indicator)
 
-        # Remove the indicator after 1 second
-        self.window.after(
-            1000, lambda: self.canvas.delete(self.opacity_indicator)
-        )
+        # Hide the indicator 1 second after the last change
+        if self._opacity_hide_id is not None:
+            self.window.after_cancel(self._opacity_hide_id)
+        self._opacity_hide_id = self.window.after(1000, self._hide_opacity_indicator)
+
+    def _hide_opacity_indicator(self):
+        self._opacity_hide_id = None
+        self.canvas.itemconfigure(self.opacity_indicator, state="hidden")
 
     def start_capture_thread(self):
+        # Window sources prefer Windows.Graphics.Capture (frames pushed by the compositor);
+        # the polling loop is the fallback when it is unavailable or fails to start.
+        if not self._start_wgc_capture():
+            self._start_capture_loop()
+        # Resampling runs on its own thread so the next grab overlaps it.
+        self.resize_thread = threading.Thread(target=self._resize_loop)
+        self.resize_thread.daemon = True
+        self.resize_thread.start()
+
+    def _start_capture_loop(self):
         self.capture_thread = threading.Thread(target=self.capture_loop)
         self.capture_thread.daemon = True
         self.capture_thread.start()
 
+    def _start_wgc_capture(self):
+        """Start a windows-capture session for a window source. Returns True on success."""
+        if not WGC_AVAILABLE or self.source_type != "window" or "hwnd" not in self.source_data:
+            return False
+        hwnd = self.source_data["hwnd"]
+        try:
+            if WGC_TAKES_HWND:
+                capture = WindowsCapture(window_hwnd=hwnd)
+            else:
+                # Older releases find the window by exact title; if another window shares
+                # it, the session could attach to the wrong one, so stay on GDI capture.
+                if not WINDOWS_CAPTURE_AVAILABLE:
+                    return False  # cannot check the title without pywin32
+                title = self.source_data["title"]
+                if _top_level_windows_titled(title) != [hwnd]:
+                    log.info("Window title %r is not unique, using GDI capture", title)
+                    return False
+                capture = WindowsCapture(window_name=title)
+            # windows-capture dispatches handlers by function name.
+            capture.event(self.on_frame_arrived)
+            capture.event(self.on_closed)
+            self._wgc_control = capture.start_free_threaded()
+            return True
+        except Exception as e:
+            log.warning("Windows.Graphics.Capture unavailable, using GDI capture: %s", e)
+            self._wgc_control = None
+            return False
+
+    def on_frame_arrived(self, frame, capture_control):
+        """windows-capture frame callback (capture session thread)."""
+        if self._stop.is_set():
+            capture_control.stop()
+            return
+        # The compositor can deliver faster than the polling cadence; keep ~30 FPS.
+        now = time.monotonic()
+        if now - self._wgc_last_t < 1.0 / 30 and not self._wake.is_set():
+            return
+        self._wgc_last_t = now
+        self._wake.clear()
+        try:
+            buf = frame.frame_buffer  # BGRA ndarray; only valid during this callback
+            if not buf.flags["C_CONTIGUOUS"]:
+                buf = buf.copy()  # rows padded to the texture pitch
+            # The BGRX decode copies, so the image outlives the frame buffer.
+            img = Image.frombuffer(
+                "RGB", (frame.width, frame.height), buf, "raw", "BGRX", 0, 1
+            )
+            self._source_size = None
+            canvas_width, canvas_height = self._canvas_size
+            self._submit_frame(img, canvas_width, canvas_height)
+        except Exception as e:
+            if _log_limiter.allow("wgc"):
+                log.warning("WGC frame error: %s", e)
+
+    def on_closed(self):
+        """windows-capture session ended (window closed or session stopped)."""
+        self._wgc_control = None
+        # Unless the PIP itself is closing, hand capture to the polling loop so the
+        # picture does not freeze on the last WGC frame.
+        if not self._stop.is_set():
+            log.info("Windows.Graphics.Capture session ended, falling back to GDI capture")
+            self._start_capture_loop()
+
     def capture_loop(self):
-        while self.running:
+        # Deadline pacing: a slow frame does not push every later frame back, and when
+        # the loop falls behind it resyncs rather than bursting to catch up.
+        period = 1.0 / 30
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                next_t += period
+                self.capture_frame()
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    if self._wake.wait(delay):
+                        self._wake.clear()
+                        next_t = time.monotonic()
+                else:
+                    next_t = time.monotonic()
+            except Exception as e:
+                if _log_limiter.allow("capture"):
+                    log.warning("Capture error: %s", e)
+                self._stop.wait(0.1)
+                next_t = time.monotonic()
+
+        self._close_sct()
+        self._free_gdi()
+        self._offer_raw(None)
+
+    def _offer_raw(self, item):
+        """Hand `item` to the resize thread, replacing an unconsumed older frame.
+
+        Only the capture thread puts, so after dropping the stale entry there is room.
+        """
+        try:
+            self._raw_q.put_nowait(item)
+        except queue.Full:
             try:
-                img = self.capture_source()
-                if img and self.window and self.window.winfo_exists():
-                    # Check if source size has changed
-                    current_source_size = (img.width, img.height)
-                    if self.last_source_size != current_source_size:
-                        self.handle_source_size_change(current_source_size)
-                        self.last_source_size = current_source_size
-
-                    canvas_width = self.canvas.winfo_width()
-                    canvas_height = self.canvas.winfo_height()
-
-                    if canvas_width > 1 and canvas_height > 1:
-                        # Always use crop logic to fill the entire window without black bars
-                        img_resized = self.resize_image_maintain_aspect(
-                            img, canvas_width, canvas_height
-                        )
-
-                        photo = ImageTk.PhotoImage(img_resized)
-                        self.window.after(0, self.update_canvas, photo)
-
-                time.sleep(0.033)
+                self._raw_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._raw_q.put_nowait(item)
+
+    def _resize_loop(self):
+        """Resample captured frames to the canvas and post them to Tk (resize thread)."""
+        while not self._stop.is_set():
+            try:
+                item = self._raw_q.get(timeout=0.25)
+            except queue.Empty:
+                continue  # no producer yet (or a WGC source gone quiet): re-check _stop
+            if item is None:
+                break
+            img, canvas_size = item
+            try:
+                if img.size == canvas_size:
+                    # Already canvas-sized (e.g. GDI-scaled or a matching region): no resample.
+                    img_resized = img
+                else:
+                    # Always use crop logic to fill the entire window without black bars
+                    img_resized = self.resize_image_maintain_aspect(img, *canvas_size)
+                self._post_frame(img_resized)
             except Exception as e:
-                print(f"Capture error: {e}")
-                time.sleep(0.1)
+                if _log_limiter.allow("resize"):
+                    log.warning("Resize error: %s", e)
+
+    def capture_frame(self):
+        """Capture one frame and queue it for the resize thread (capture thread)."""
+        canvas_width, canvas_height = self._canvas_size
+        if canvas_width > 1 and canvas_height > 1:
+            self._target_size = (canvas_width, canvas_height)
+        else:
+            self._target_size = None
+        self._source_size = None
+
+        img = self.capture_source()
+        self._submit_frame(img, canvas_width, canvas_height)
+
+    def _submit_frame(self, img, canvas_width, canvas_height):
+        """Track source size changes and queue `img` for the resize thread."""
+        if img and self.window and self.window.winfo_exists():
+            # Check if source size has changed (GDI may already have scaled the image)
+            current_source_size = self._source_size or (img.width, img.height)
+            if self.last_source_size != current_source_size:
+                self.handle_source_size_change(current_source_size)
+                self.last_source_size = current_source_size
+
+            if canvas_width > 1 and canvas_height > 1:
+                self._offer_raw((img, (canvas_width, canvas_height)))
+
+    def _post_frame(self, img):
+        """Queue `img` for display; at most one flush is pending, showing the newest frame."""
+        with self._frame_lock:
+            self._pending_frame = img
+            if self._flush_scheduled:
+                return  # the pending flush will pick up this (newer) frame instead
+            self._flush_scheduled = True
+        try:
+            self.window.after(0, self._flush_frame)
+        except Exception:
+            with self._frame_lock:
+                self._flush_scheduled = False
+            raise
+
+    def _flush_frame(self):
+        with self._frame_lock:
+            img = self._pending_frame
+            self._pending_frame = None
+            self._flush_scheduled = False
+        if img is not None:
+            self.update_canvas(img)
 
     def handle_source_size_change(self, new_size):
         """Handle changes in source size by updating aspect ratio and PIP window"""
+        # Monitor geometry may have changed too. mss caches it per instance, so drop the
+        # instance and let the next grab open a fresh one (runs on the capture thread).
+        self._close_sct()
         try:
             if not self.maintain_aspect_ratio:
                 return
@@ -444,19 +827,35 @@ class InfinitePIPWindow:
 
                 # Only update if aspect ratio has changed significantly
                 if (self.source_aspect_ratio is None) or (
-                    abs(new_aspect_ratio - self.source_aspect_ratio) > 0.01
+                    abs(new_aspect_ratio - self.source_aspect_ratio) > _ASPECT_EPSILON
                 ):
-                    print(
-                        f"Source size changed to {new_width}x{new_height}, updating aspect ratio"
+                    log.debug(
+                        "Source size changed to %sx%s, updating aspect ratio", new_width, new_height
                     )
-                    self.source_aspect_ratio = new_aspect_ratio
+                    self._set_aspect_ratio(new_aspect_ratio)
 
                     # Update PIP window size to match new aspect ratio if auto-resize is enabled
                     if self.auto_resize_on_source_change:
-                        self.window.after(0, self.update_pip_window_size)
+                        self._schedule_pip_window_size()
 
         except Exception as e:
-            print(f"Error handling source size change: {e}")
+            if _log_limiter.allow("source_size"):
+                log.warning("Error handling source size change: %s", e)
+
+    def _schedule_pip_window_size(self):
+        """Queue one update_pip_window_size on the Tk thread; repeat requests coalesce."""
+        if self._pip_resize_pending:
+            return
+        self._pip_resize_pending = True
+        try:
+            self.window.after(0, self._do_update_pip_window_size)
+        except Exception:
+            self._pip_resize_pending = False
+            raise
+
+    def _do_update_pip_window_size(self):
+        self._pip_resize_pending = False
+        self.update_pip_window_size()
 
     def update_pip_window_size(self):
         """Update PIP window size to match new source aspect ratio"""
@@ -470,15 +869,16 @@ class InfinitePIPWindow:
             current_width = self.window.winfo_width()
             current_height = self.window.winfo_height()
 
+            ratio = self.source_aspect_ratio
+            inv_ratio = self._inv_aspect_ratio
+
             # Calculate new size maintaining the current width but adjusting height
-            new_height = int(current_width / self.source_aspect_ratio)
-            new_height = max(150, new_height)  # Ensure minimum height
+            new_height = max(150, int(current_width * inv_ratio))  # Ensure minimum height
 
             # If the calculated height is too different, adjust width instead
             if abs(new_height - current_height) > current_height * 0.5:
-                new_width = int(current_height * self.source_aspect_ratio)
-                new_width = max(200, new_width)  # Ensure minimum width
-                new_height = int(new_width / self.source_aspect_ratio)
+                new_width = max(200, int(current_height * ratio))  # Ensure minimum width
+                new_height = int(new_width * inv_ratio)
             else:
                 new_width = current_width
 
@@ -489,10 +889,10 @@ class InfinitePIPWindow:
             # Update window geometry
             self.window.geometry(f"{new_width}x{new_height}+{current_x}+{current_y}")
 
-            print(f"Updated PIP window size to {new_width}x{new_height}")
+            log.debug("Updated PIP window size to %sx%s", new_width, new_height)
 
         except Exception as e:
-            print(f"Error updating PIP window size: {e}")
+            log.warning("Error updating PIP window size: %s", e)
 
     def capture_source(self):
         try:
@@ -503,17 +903,46 @@ class InfinitePIPWindow:
             elif self.source_type == "region":
                 return self.capture_region()
         except Exception as e:
-            print(f"Source capture error: {e}")
+            if _log_limiter.allow("source"):
+                log.warning("Source capture error: %s", e)
             return None
 
+    def _get_sct(self):
+        # One mss instance for the life of the capture thread instead of one per frame.
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct
+
+    def _close_sct(self):
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+        self._monitors = None
+
+    def _grab_rect(self, left, top, width, height):
+        """Grab a screen rectangle with the capture thread's mss instance.
+
+        Decodes `screenshot.raw` (see `capture_monitor`); the BGRX decode makes the one copy.
+        """
+        rect = {"left": left, "top": top, "width": width, "height": height}
+        screenshot = self._get_sct().grab(rect)
+        return Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1)
+
     def capture_monitor(self):
-        with mss.mss() as sct:
-            monitors = sct.monitors
-            monitor_index = self.source_data["index"]
-            if monitor_index < len(monitors) - 1:
-                monitor = monitors[monitor_index + 1]
-                screenshot = sct.grab(monitor)
-                return Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+        sct = self._get_sct()
+        monitors = self._monitors
+        if monitors is None:
+            monitors = self._monitors = sct.monitors
+        monitor_index = self.source_data["index"]
+        if monitor_index < len(monitors) - 1:
+            monitor = monitors[monitor_index + 1]
+            screenshot = sct.grab(monitor)
+            # Decode from the grab buffer: this skips `.rgb` (a Python-side repack) and
+            # `.bgra` (a bytes copy of `.raw`), leaving only the copy the BGRX decode makes.
+            return Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1)
         return None
 
     def capture_window(self):
@@ -525,53 +954,25 @@ class InfinitePIPWindow:
                 # Fallback to region capture with dynamic window tracking
                 return self.capture_window_region_dynamic()
         except Exception as e:
-            print(f"Window capture error: {e}")
+            if _log_limiter.allow("window"):
+                log.warning("Window capture error: %s", e)
             return None
 
     def capture_window_direct(self, hwnd):
         """Direct window capture on Windows using Win32 API"""
         try:
-            # Check if window still exists and is visible
-            if not win32gui.IsWindow(hwnd):
-                return None
-
-            # Get window rect (full window including borders)
-            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-            width = right - left
-            height = bottom - top
-
-            # Try to get client area (content area without borders) for better capture
-            try:
-                client_rect = win32gui.GetClientRect(hwnd)
-                client_width = client_rect[2]
-                client_height = client_rect[3]
-
-                # Use client area if it's reasonable (not too small)
-                if client_width > 100 and client_height > 100:
-                    width = client_width
-                    height = client_height
-            except Exception:
-                pass  # Use window rect if client rect fails
-
-            # Check if window size has changed and update tracking
-            current_bbox = (left, top, width, height)
-            if ("bbox" in self.source_data) and (self.source_data["bbox"] != current_bbox):
-                old_bbox = self.source_data["bbox"]
-                self.source_data["bbox"] = current_bbox
-
-                # Check if size changed (not just position)
-                if old_bbox[2:] != current_bbox[2:]:
-                    print(
-                        f"Direct capture detected size change from {old_bbox[2]}x{old_bbox[3]} to {width}x{height}"
-                    )
-                    # Size change will be handled by the main capture loop
+            self._win_meta_tick += 1
+            meta = self._win_meta
+            if meta is None or meta[0] != hwnd or self._win_meta_tick >= _WIN_META_FRAMES:
+                self._win_meta_tick = 0
+                meta = self._win_meta = self._query_window_meta(hwnd)
+                if meta is None:
+                    return None
+            _hwnd, width, height, iconic = meta
+            self._source_size = (width, height)
 
             # Skip if window is minimized or has no size
-            if width <= 0 or height <= 0:
-                return self.create_placeholder_image("Window Minimized")
-
-            # Check if window is minimized
-            if win32gui.IsIconic(hwnd):
+            if width <= 0 or height <= 0 or iconic:
                 return self.create_placeholder_image("Window Minimized")
 
             # Try PrintWindow first (works better for some applications)
@@ -580,114 +981,160 @@ class InfinitePIPWindow:
                 return img
 
             # Fallback to BitBlt (more reliable for others)
-            return self.capture_with_bitblt(hwnd, width, height)
+            img = self.capture_with_bitblt(hwnd, width, height)
+            if img is None:
+                self._win_meta = None  # both failed: re-check the window next frame
+            return img
 
         except Exception as e:
-            print(f"Direct window capture error: {e}")
+            if _log_limiter.allow("direct"):
+                log.warning("Direct window capture error: %s", e)
             return None
 
-    def capture_with_print_window(self, hwnd, width, height):
-        """Capture using PrintWindow API"""
+    def _query_window_meta(self, hwnd):
+        """Read `(hwnd, width, height, iconic)` for a window and track its bbox (None if gone)."""
+        # Check if window still exists and is visible
+        if not win32gui.IsWindow(hwnd):
+            return None
+
+        # Get window rect (full window including borders)
+        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        width = right - left
+        height = bottom - top
+
+        # Try to get client area (content area without borders) for better capture
         try:
-            # Get window device context
-            hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
-
-            # Create bitmap
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-            saveDC.SelectObject(saveBitMap)
-
-            # Copy window content to bitmap using ctypes
-            result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), 3)  # PW_RENDERFULLCONTENT
-
-            if result:
-                # Convert to PIL Image
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-
-                img = Image.frombuffer(
-                    "RGB",
-                    (bmpinfo["bmWidth"], bmpinfo["bmHeight"]),
-                    bmpstr,
-                    "raw",
-                    "BGRX",
-                    0,
-                    1,
+            client_rect = win32gui.GetClientRect(hwnd)
+            client_width = client_rect[2]
+            client_height = client_rect[3]
+
+            # Use client area if it's reasonable (not too small)
+            if client_width > 100 and client_height > 100:
+                width = client_width
+                height = client_height
+        except Exception:
+            pass  # Use window rect if client rect fails
+
+        # Check if window size has changed and update tracking
+        current_bbox = (left, top, width, height)
+        if ("bbox" in self.source_data) and (self.source_data["bbox"] != current_bbox):
+            old_bbox = self.source_data["bbox"]
+            self.source_data["bbox"] = current_bbox
+
+            # Check if size changed (not just position)
+            if old_bbox[2:] != current_bbox[2:]:
+                log.debug(
+                    "Direct capture detected size change from %sx%s to %sx%s",
+                    old_bbox[2],
+                    old_bbox[3],
+                    width,
+                    height,
                 )
+                # Size change will be handled by the main capture loop
 
-                # Clean up
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+        return (hwnd, width, height, bool(win32gui.IsIconic(hwnd)))
 
-                return img
-            else:
-                # Clean up on failure
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+    def _frame_dib(self, width, height, slot="frame"):
+        """Memory DC + top-down DIB for `slot`, reused while its size is unchanged.
+
+        Slots: "frame" (full window size) and "scaled" (canvas size). Returns
+        `(mem_dc, bits_address)`. Capture thread only; freed by `_free_gdi`.
+        """
+        gdi = self._gdi.get(slot)
+        if gdi is not None and gdi[0] == (width, height):
+            return gdi[1], gdi[3]
+        self._free_gdi(slot)
+
+        mem_dc = create_compatible_dc(None)
+        try:
+            # Top-down 32-bpp DIB section: rows come out in the order Pillow expects
+            # and the pixel memory is read in place (no GetBitmapBits copy).
+            hbitmap, bits = create_top_down_dib(mem_dc, width, height)
+        except Exception:
+            delete_dc(mem_dc)
+            raise
+        old_bitmap = select_object(mem_dc, hbitmap)
+        self._gdi[slot] = ((width, height), mem_dc, hbitmap, bits, old_bitmap)
+        return mem_dc, bits
+
+    def _free_gdi(self, slot=None):
+        """Free one DIB slot, or all of them."""
+        slots = list(self._gdi) if slot is None else [slot]
+        for name in slots:
+            gdi = self._gdi.pop(name, None)
+            if gdi is None:
+                continue
+            _size, mem_dc, hbitmap, _bits, old_bitmap = gdi
+            try:
+                select_object(mem_dc, old_bitmap)
+                delete_object(hbitmap)
+                delete_dc(mem_dc)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _dib_to_image(bits, width, height):
+        # The BGRX decode copies out of the DIB, so the DIB can be reused next frame.
+        # Pillow stores "RGB" as 4 bytes/pixel, so this is a same-stride swizzle;
+        # decoding as RGBA/BGRA would keep GDI's undefined alpha (often 0).
+        return Image.frombuffer(
+            "RGB", (width, height), dib_buffer(bits, width, height), "raw", "BGRX", 0, 1
+        )
+
+    def _scaled_image(self, src_dc, width, height):
+        """Crop-to-fill and HALFTONE-scale `src_dc` to the canvas size inside GDI.
+
+        Returns None when no canvas size is known (the caller then reads full size).
+        Only canvas-sized pixels are copied into Python.
+        """
+        target = self._target_size
+        if target is None:
+            return None
+        dst_w, dst_h = target
+        src_x, src_y, src_w, src_h = _fill_crop(width, height, dst_w, dst_h)
+        dst_dc, bits = self._frame_dib(dst_w, dst_h, "scaled")
+        if not stretch_blt_halftone(dst_dc, dst_w, dst_h, src_dc, src_w, src_h, src_x, src_y):
+            return None
+        return self._dib_to_image(bits, dst_w, dst_h)
+
+    def capture_with_print_window(self, hwnd, width, height):
+        """Capture using PrintWindow API"""
+        try:
+            mem_dc, bits = self._frame_dib(width, height)
+            if not windll.user32.PrintWindow(hwnd, mem_dc, 3):  # PW_RENDERFULLCONTENT
                 return None
+            return self._scaled_image(mem_dc, width, height) or self._dib_to_image(
+                bits, width, height
+            )
 
         except Exception as e:
-            print(f"PrintWindow capture error: {e}")
+            if _log_limiter.allow("printwindow"):
+                log.warning("PrintWindow capture error: %s", e)
             return None
 
     def capture_with_bitblt(self, hwnd, width, height):
         """Capture using BitBlt API (fallback method)"""
+        hwndDC = None
         try:
-            # Get window device context
             hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
-
-            # Create bitmap
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-            saveDC.SelectObject(saveBitMap)
-
-            # Copy window content using BitBlt
-            result = saveDC.BitBlt(
-                (0, 0), (width, height), mfcDC, (0, 0), win32con.SRCCOPY
-            )
-
-            if result:
-                # Convert to PIL Image
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-
-                img = Image.frombuffer(
-                    "RGB",
-                    (bmpinfo["bmWidth"], bmpinfo["bmHeight"]),
-                    bmpstr,
-                    "raw",
-                    "BGRX",
-                    0,
-                    1,
-                )
-
-                # Clean up
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
-
+            # Scale straight out of the window DC when the canvas size is known.
+            img = self._scaled_image(hwndDC, width, height)
+            if img is not None:
                 return img
-            else:
-                # Clean up on failure
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
+            mem_dc, bits = self._frame_dib(width, height)
+            if not bit_blt(mem_dc, width, height, hwndDC):
                 return None
+            return self._dib_to_image(bits, width, height)
 
         except Exception as e:
-            print(f"BitBlt capture error: {e}")
+            if _log_limiter.allow("bitblt"):
+                log.warning("BitBlt capture error: %s", e)
             return None
 
+        finally:
+            if hwndDC:
+                win32gui.ReleaseDC(hwnd, hwndDC)
+
     def capture_window_region_dynamic(self):
         """Dynamic region capture that tracks window position"""
         try:
@@ -696,24 +1143,34 @@ class InfinitePIPWindow:
                 self.update_window_position()
 
             # Use current bbox for capture
-            bbox = self.source_data["bbox"]
-            screenshot = pyautogui.screenshot(region=bbox)
-            return screenshot
+            return self._grab_rect(*self.source_data["bbox"])
         except Exception as e:
-            print(f"Dynamic region capture error: {e}")
+            if _log_limiter.allow("dynamic_region"):
+                log.warning("Dynamic region capture error: %s", e)
             return None
 
     def update_window_position(self):
         """Update window position for dynamic tracking"""
+        if gw is None:
+            return
         try:
-            import pygetwindow as gw
-
-            windows = gw.getWindowsWithTitle(self.source_data["title"])
-            if windows:
-                window = windows[0]
+            # Reuse the matched window instead of a title search every frame; search
+            # again only once it stops answering (closed) or no match was found yet.
+            window = self._tracked_window
+            new_bbox = None
+            if window is not None:
+                try:
+                    new_bbox = tuple(window.box)
+                except Exception:
+                    window = self._tracked_window = None
+            if window is None:
+                windows = gw.getWindowsWithTitle(self.source_data["title"])
+                if windows:
+                    window = self._tracked_window = windows[0]
+                    new_bbox = tuple(window.box)
+            if window is not None:
                 # Update the bbox with current window position
                 old_bbox = self.source_data["bbox"]
-                new_bbox = (window.left, window.top, window.width, window.height)
 
                 # Only update if window has actually moved or resized
                 if old_bbox != new_bbox:
@@ -721,14 +1178,21 @@ class InfinitePIPWindow:
 
                     # Update aspect ratio if window size changed
                     if old_bbox[2:] != new_bbox[2:]:  # Width or height changed
-                        old_aspect = old_bbox[2] / old_bbox[3] if old_bbox[3] > 0 else None
                         new_aspect = new_bbox[2] / new_bbox[3] if new_bbox[3] > 0 else None
 
-                        if old_aspect != new_aspect:
-                            print(
-                                f"Window size changed from {old_bbox[2]}x{old_bbox[3]} to {new_bbox[2]}x{new_bbox[3]}"
+                        # Compare with the applied ratio so slow drags still add up.
+                        if new_aspect is not None and (
+                            self.source_aspect_ratio is None
+                            or abs(new_aspect - self.source_aspect_ratio) > _ASPECT_EPSILON
+                        ):
+                            log.debug(
+                                "Window size changed from %sx%s to %sx%s",
+                                old_bbox[2],
+                                old_bbox[3],
+                                new_bbox[2],
+                                new_bbox[3],
                             )
-                            self.source_aspect_ratio = new_aspect
+                            self._set_aspect_ratio(new_aspect)
 
                             # Update PIP window size immediately if auto-resize is enabled
                             if (
@@ -737,13 +1201,17 @@ class InfinitePIPWindow:
                                 and self.window
                                 and self.window.winfo_exists()
                             ):
-                                self.window.after(0, self.update_pip_window_size)
+                                self._schedule_pip_window_size()
 
         except Exception as e:
-            print(f"Window position update error: {e}")
+            if _log_limiter.allow("window_position"):
+                log.warning("Window position update error: %s", e)
 
     def create_placeholder_image(self, text):
-        """Create a placeholder image with text"""
+        """Create a placeholder image with text (cached per text)"""
+        img = InfinitePIPWindow._placeholder_cache.get(text)
+        if img is not None:
+            return img
         try:
             # Create a simple placeholder image
             width, height = 400, 300
@@ -756,10 +1224,13 @@ class InfinitePIPWindow:
                 draw = ImageDraw.Draw(img)
 
                 # Try to use a system font
-                try:
-                    font = ImageFont.truetype("arial.ttf", 16)
-                except Exception:
-                    font = ImageFont.load_default()
+                font = InfinitePIPWindow._placeholder_font
+                if font is None:
+                    try:
+                        font = ImageFont.truetype("arial.ttf", 16)
+                    except Exception:
+                        font = ImageFont.load_default()
+                    InfinitePIPWindow._placeholder_font = font
 
                 # Calculate text position
                 text_bbox = draw.textbbox((0, 0), text, font=font)
@@ -775,9 +1246,11 @@ class InfinitePIPWindow:
             except ImportError:
                 pass  # Skip text if ImageDraw not available
 
+            InfinitePIPWindow._placeholder_cache[text] = img
             return img
         except Exception as e:
-            print(f"Placeholder image creation error: {e}")
+            if _log_limiter.allow("placeholder"):
+                log.warning("Placeholder image creation error: %s", e)
             return None
 
     def capture_region(self):
@@ -788,53 +1261,44 @@ class InfinitePIPWindow:
                 self.source_data["width"],
                 self.source_data["height"],
             )
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-            return screenshot
+            return self._grab_rect(x, y, width, height)
         except Exception as e:
-            print(f"Region capture error: {e}")
+            if _log_limiter.allow("region"):
+                log.warning("Region capture error: %s", e)
             return None
 
     def resize_image_maintain_aspect(self, img, target_width, target_height):
         """Resize image to fill target dimensions while maintaining aspect ratio (crop if needed)"""
-        original_width, original_height = img.size
-        original_aspect = original_width / original_height
-        target_aspect = target_width / target_height
-
-        if original_aspect > target_aspect:
-            # Image is wider than target - fit to height and crop width
-            new_height = target_height
-            new_width = int(target_height * original_aspect)
-
-            # Resize image
-            resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Crop to fit target width (center crop)
-            crop_x = (new_width - target_width) // 2
-            result_img = resized_img.crop((crop_x, 0, crop_x + target_width, target_height))
+        # Nearest-neighbour while the user drags a resize: every frame is a new size then.
+        if self.fast_resample or self.is_resizing:
+            resample = Image.Resampling.NEAREST
         else:
-            # Image is taller than target - fit to width and crop height
-            new_width = target_width
-            new_height = int(target_width / original_aspect)
+            resample = RESAMPLE_FILTER
 
-            # Resize image
-            resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        box = _resize_box(img.width, img.height, target_width, target_height)
 
-            # Crop to fit target height (center crop)
-            crop_y = (new_height - target_height) // 2
-            result_img = resized_img.crop((0, crop_y, target_width, crop_y + target_height))
+        # Crop and scale in one resample: only the visible part of the source is filtered.
+        # reducing_gap lets Pillow box-reduce large downscales by an integer factor first,
+        # so the filter runs over far fewer pixels (ignored for NEAREST).
+        return img.resize((target_width, target_height), resample, box=box, reducing_gap=3.0)
 
-        return result_img
-
-    def update_canvas(self, photo):
+    def update_canvas(self, img):
+        """Show a PIL frame, pasting into the existing Tk photo when the size is unchanged."""
         if self.canvas and self.canvas.winfo_exists():
-            self.canvas.delete("all")
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            self.canvas.create_image(canvas_width // 2, canvas_height // 2, image=photo)
-            self.canvas.image = photo
-
-            # Add subtle resize indicators on borderless window
-            self.draw_resize_indicators(canvas_width, canvas_height)
+            canvas_width, canvas_height = self._canvas_size
+
+            photo = self._tk_photo
+            if photo is None or (photo.width(), photo.height()) != img.size:
+                photo = self._tk_photo = ImageTk.PhotoImage(img)
+                if self._canvas_image_id is None:
+                    self._canvas_image_id = self.canvas.create_image(
+                        canvas_width // 2, canvas_height // 2, image=photo
+                    )
+                    self.canvas.tag_lower(self._canvas_image_id)
+                else:
+                    self.canvas.itemconfigure(self._canvas_image_id, image=photo)
+            else:
+                photo.paste(img)
 
     def draw_resize_indicators(self, width, height):
         """Draw subtle resize indicators on borderless window"""
@@ -844,26 +1308,46 @@ class InfinitePIPWindow:
 
         # Bottom-right corner
         self.canvas.create_rectangle(
-            width - corner_size, height - corner_size, width, height, fill=indicator_color, outline=""
+            width - corner_size, height - corner_size, width, height,
+            fill=indicator_color,
+            outline="",
+            tags="resize_indicator",
         )
 
         # Bottom-left corner
         self.canvas.create_rectangle(
-            0, height - corner_size, corner_size, height, fill=indicator_color, outline=""
+            0, height - corner_size, corner_size, height,
+            fill=indicator_color,
+            outline="",
+            tags="resize_indicator",
         )
 
         # Top-right corner
         self.canvas.create_rectangle(
-            width - corner_size, 0, width, corner_size, fill=indicator_color, outline=""
+            width - corner_size, 0, width, corner_size,
+            fill=indicator_color,
+            outline="",
+            tags="resize_indicator",
         )
 
         # Top-left corner
         self.canvas.create_rectangle(
-            0, 0, corner_size, corner_size, fill=indicator_color, outline=""
+            0, 0, corner_size, corner_size,
+            fill=indicator_color,
+            outline="",
+            tags="resize_indicator",
         )
 
     def close(self):
         self.running = False
+        self._stop.set()
+        self._wake.set()
+        if self._wgc_control is not None:
+            try:
+                self._wgc_control.stop()
+            except Exception:
+                pass
+            self._wgc_control = None
         if self.window:
             self.window.destroy()
         self.manager.remove_pip(self)
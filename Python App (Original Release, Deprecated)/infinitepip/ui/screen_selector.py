@@ -57,7 +57,7 @@ class ScreenAreaSelector:
                 screenshot = sct.grab(monitor)
 
                 # Convert to PIL Image
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+                img = Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1)
 
                 # Apply dark overlay
                 overlay = Image.new(
@@ -123,10 +123,11 @@ class ScreenAreaSelector:
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
 
-            if canvas_width > 1 and canvas_height > 1:
-                bg_img = bg_img.resize(
-                    (canvas_width, canvas_height), Image.Resampling.LANCZOS
-                )
+            # The overlay normally covers the captured desktop 1:1, so usually no resample;
+            # otherwise reducing_gap box-reduces large downscales before LANCZOS.
+            canvas_size = (canvas_width, canvas_height)
+            if canvas_width > 1 and canvas_height > 1 and bg_img.size != canvas_size:
+                bg_img = bg_img.resize(canvas_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
             # Convert to PhotoImage
             self.background_image = ImageTk.PhotoImage(bg_img)
@@ -17,11 +17,9 @@ class ModernScrollableFrame(ttk.Frame):
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
 
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
+        # Configure scrolling (suspendable while callers insert many children)
+        self._scroll_suspended = False
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
 
         # Create window in canvas
         self.canvas_window = self.canvas.create_window(
@@ -46,6 +44,23 @@ class ModernScrollableFrame(ttk.Frame):
         except Exception:
             pass
 
+    def _on_frame_configure(self, _event=None):
+        """Track content size changes in the canvas scroll region."""
+        if not self._scroll_suspended:
+            self._update_scrollregion()
+
+    def _update_scrollregion(self) -> None:
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def suspend_scrollregion(self) -> None:
+        """Stop recomputing the scroll region until `resume_scrollregion` (batch inserts)."""
+        self._scroll_suspended = True
+
+    def resume_scrollregion(self) -> None:
+        """Re-enable scroll region tracking and refresh it once for the whole batch."""
+        self._scroll_suspended = False
+        self._update_scrollregion()
+
     def _on_canvas_configure(self, event):
         """Handle canvas resize to make scrollable frame fit width"""
         canvas_width = event.width
@@ -93,6 +108,7 @@ class ModernCard(tk.Frame):
         self._bg = bg
         self._border = border
         self._border_hover = border_hover
+        self._hovered = False  # border colour currently applied, to skip redundant configures
 
         # Border (use highlight* for precise color)
         self.configure(highlightthickness=1, highlightbackground=self._border, highlightcolor=self._border)
@@ -147,24 +163,34 @@ class ModernCard(tk.Frame):
         for child in widget.winfo_children():
             self._bind_hover_recursive(child)
 
+    def _set_hovered(self, hovered: bool) -> None:
+        color = self._border_hover if hovered else self._border
+        self.configure(highlightbackground=color, highlightcolor=color)
+        self._hovered = hovered
+
     def _on_enter(self, _event=None) -> None:
+        # Enter fires again for every child the pointer crosses; only the first one matters.
+        if self._hovered:
+            return
         try:
             # TSX hover is orange border at 50% opacity; Tk doesn't do alpha on borders,
             # so we use solid orange which reads the closest.
-            self.configure(highlightbackground=self._border_hover, highlightcolor=self._border_hover)
+            self._set_hovered(True)
         except Exception:
             pass
 
     def _on_leave(self, _event=None) -> None:
+        if not self._hovered:
+            return
         # Only un-hover if the pointer is outside the card bounds.
         try:
             x, y = self.winfo_pointerxy()
             if not (self.winfo_rootx() <= x <= self.winfo_rootx() + self.winfo_width() and
                     self.winfo_rooty() <= y <= self.winfo_rooty() + self.winfo_height()):
-                self.configure(highlightbackground=self._border, highlightcolor=self._border)
+                self._set_hovered(False)
         except Exception:
             try:
-                self.configure(highlightbackground=self._border, highlightcolor=self._border)
+                self._set_hovered(False)
             except Exception:
                 pass
 